@@ -7,6 +7,45 @@ import numpy as np
 
 GREEN_KERNEL = np.ones((3, 3), np.uint8)
 
+# 3x3 ellipse used to clean up the segmentation / subtractor masks
+ELLIPSE_KERNEL = cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (3, 3))
+
+# Rows of a 2x3 colour transform over (B, G, R).  Each output channel is one
+# side of ``2G > min(2R + B, R + 2B)``; uint8 saturation clamps the negative
+# (non-green) results to 0, so a pixel is green iff either channel is > 0.
+_GREEN_MATRIX = np.array([[-1.0, 2.0, -2.0],
+                          [-2.0, 2.0, -1.0]], np.float32)
+
+def green_mask(frame_bgr: np.ndarray) -> np.ndarray:
+    """Return a uint8 mask that is non-zero where the pixel is considered green.
+
+    Evaluates ``G > min(R + 0.5*B, 0.5*R + B)`` in a single ``cv2.transform``
+    pass followed by a channel max, without any full-frame temporaries.
+    """
+    return cv2.transform(frame_bgr, _GREEN_MATRIX).max(axis=2)
+
+def green_alpha(frame_bgr: np.ndarray) -> np.ndarray:
+    """Return the alpha channel for the simple chroma key (0 on dilated green)."""
+    mask = cv2.dilate(green_mask(frame_bgr), GREEN_KERNEL, iterations=1)
+    _, alpha = cv2.threshold(mask, 0, 255, cv2.THRESH_BINARY_INV)
+    return alpha
+
+# mixChannels pairs: BGR channels 0..2 -> 0..2, alpha (input channel 3) -> 3
+_BGRA_FROM_TO = [0, 0, 1, 1, 2, 2, 3, 3]
+
+def bgra_with_alpha(frame_bgr: np.ndarray, alpha: np.ndarray) -> np.ndarray:
+    """Return *frame_bgr* extended by the *alpha* channel as a new BGRA image.
+
+    A single ``mixChannels`` pass interleaves B, G, R and alpha into one
+    uninitialised buffer, instead of letting ``cvtColor`` write an opaque
+    alpha that is overwritten right away.  A fresh buffer is returned on
+    every call because callers keep the frames.
+    """
+    h, w = frame_bgr.shape[:2]
+    rgba = np.empty((h, w, 4), np.uint8)
+    cv2.mixChannels([frame_bgr, alpha], [rgba], _BGRA_FROM_TO)
+    return rgba
+
 def greenscreen_remove_simple(frame_bgr: np.ndarray) -> np.ndarray:
     """Return an RGBA image with green pixels made fully transparent.
 
@@ -14,20 +53,71 @@ def greenscreen_remove_simple(frame_bgr: np.ndarray) -> np.ndarray:
     if the green channel is considerably stronger than the red & blue
     channels.
     """
-    B, G, R = [c.astype(np.float32) for c in cv2.split(frame_bgr)]
-    green_thresh = np.minimum(R + 0.5 * B, 0.5 * R + B)
-    mask = (G > green_thresh).astype(np.uint8)
-    mask = cv2.dilate(mask, GREEN_KERNEL, iterations=1)
-    alpha = np.where(mask > 0, 0, 255).astype(np.uint8)
-
-    rgba = cv2.cvtColor(frame_bgr, cv2.COLOR_BGR2BGRA)
-    rgba[:, :, 3] = alpha
-    return rgba
+    return bgra_with_alpha(frame_bgr, green_alpha(frame_bgr))
+
+# ──────────────────────────────────────────────────────────────────────
+#  HSV range chroma-key removal
+# ──────────────────────────────────────────────────────────────────────
+
+# OpenCV hue is 0..179, so 35..85 covers the green sector of the wheel.
+HSV_GREEN_LOW = (35, 40, 40)
+HSV_GREEN_HIGH = (85, 255, 255)
+
+def greenscreen_remove_hsv(frame_bgr: np.ndarray) -> np.ndarray:
+    """Return an RGBA image with pixels in the green HSV range made transparent.
+
+    A single ``cvtColor`` + ``inRange`` pass yields the uint8 mask directly;
+    it is then dilated exactly like the simple method.
+    """
+    hsv = cv2.cvtColor(frame_bgr, cv2.COLOR_BGR2HSV)
+    mask = cv2.inRange(hsv, HSV_GREEN_LOW, HSV_GREEN_HIGH)
+    alpha = cv2.bitwise_not(cv2.dilate(mask, GREEN_KERNEL, iterations=1))
+    return bgra_with_alpha(frame_bgr, alpha)
 
 # ──────────────────────────────────────────────────────────────────────
 #  Segmentation-based removal using GrabCut
 # ──────────────────────────────────────────────────────────────────────
 
+# Pixels whose green excess G - max(R, B) lies in (margin, AMBIGUOUS_GREEN]
+# are "weakly green" (spill, shadows, anti-aliased edges).  When they make up
+# less than AMBIGUOUS_FRACTION of the frame the obvious-green mask is already
+# final and GrabCut is skipped.
+AMBIGUOUS_GREEN = 40
+AMBIGUOUS_FRACTION = 0.01
+
+def _lazy_grabcut_models():
+    """Create (once) and return the GrabCut background/foreground model buffers.
+
+    GC_INIT_WITH_MASK re-initialises them on every call, so one pair can be
+    shared by all frames.
+    """
+    if not hasattr(_lazy_grabcut_models, "models"):
+        _lazy_grabcut_models.models = (np.zeros((1, 65), np.float64),
+                                       np.zeros((1, 65), np.float64))
+    return _lazy_grabcut_models.models
+
+def _grabcut_half_res(frame_bgr: np.ndarray, grabcut_mask: np.ndarray) -> np.ndarray:
+    """Run GrabCut on a half-resolution copy and return a full-size 0/1 FG mask.
+
+    GrabCut cost grows with the pixel count, so this is ~4x cheaper than
+    running it on the full frame; pixels that are sure background at full
+    resolution stay background.
+    """
+    h, w = grabcut_mask.shape
+    small_size = (max(1, w // 2), max(1, h // 2))
+    small = cv2.resize(frame_bgr, small_size, interpolation=cv2.INTER_AREA)
+    small_mask = cv2.resize(grabcut_mask, small_size, interpolation=cv2.INTER_NEAREST)
+
+    bgd_model, fgd_model = _lazy_grabcut_models()
+    cv2.grabCut(small, small_mask, None, bgd_model, fgd_model,
+                5, mode=cv2.GC_INIT_WITH_MASK)
+
+    small_fg = np.where((small_mask == cv2.GC_FGD) | (small_mask == cv2.GC_PR_FGD),
+                        np.uint8(255), np.uint8(0))
+    mask_fg = cv2.resize(small_fg, (w, h), interpolation=cv2.INTER_LINEAR) > 127
+    mask_fg &= grabcut_mask != cv2.GC_BGD
+    return mask_fg.view(np.uint8)
+
 def greenscreen_remove_segmentation(frame_bgr: np.ndarray) -> np.ndarray:
     """Remove green background using GrabCut segmentation.
 
@@ -35,8 +125,9 @@ def greenscreen_remove_segmentation(frame_bgr: np.ndarray) -> np.ndarray:
     1. Pixels where G > max(R, B) + margin are marked as likely background.
     2. These pixels plus a small image border are provided to GrabCut as
        *sure background*, everything else as *probable foreground*.
-    3. GrabCut refines the mask to separate the main object from the green
-       background.
+    3. If only a few pixels are weakly green the mask from step 2 is used
+       as is; otherwise GrabCut refines it (at half resolution) to separate
+       the main object from the green background.
     4. The resulting mask is converted to an RGBA image with transparency.
     """
     h, w, _ = frame_bgr.shape
@@ -44,37 +135,29 @@ def greenscreen_remove_segmentation(frame_bgr: np.ndarray) -> np.ndarray:
     # Step 1: obvious green background
     B, G, R = cv2.split(frame_bgr)
     margin = 5  # small tolerance so that near-neutral pixels stay untouched
-    initial_bg = (G.astype(np.int16) > np.maximum(R, B) + margin).astype(np.uint8)
+    green_excess = G.astype(np.int16) - np.maximum(R, B)
+    initial_bg = (green_excess > margin).view(np.uint8)
 
     # Step 2: erode to shrink background mask and avoid halos
-    kernel = cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (3, 3))
-    initial_bg = cv2.erode(initial_bg, kernel, iterations=1)
-
-    # Prepare the GrabCut mask – non-green area is *probable foreground*
-    grabcut_mask = np.full((h, w), cv2.GC_PR_FGD, dtype=np.uint8)  # probable FG by default
-    grabcut_mask[initial_bg == 1] = cv2.GC_BGD                     # sure background
+    initial_bg = cv2.erode(initial_bg, ELLIPSE_KERNEL, iterations=1)
 
-    # Border of the frame is almost certainly background — mark as sure bg
+    # Prepare the GrabCut mask – non-green area is *probable foreground*, and
+    # the border of the frame is almost certainly background (sure bg)
     border = 5
-    grabcut_mask[:border, :] = cv2.GC_BGD
-    grabcut_mask[-border:, :] = cv2.GC_BGD
-    grabcut_mask[:, :border] = cv2.GC_BGD
-    grabcut_mask[:, -border:] = cv2.GC_BGD
-
-    # Step 4: GrabCut refinement
-    bgd_model = np.zeros((1, 65), np.float64)
-    fgd_model = np.zeros((1, 65), np.float64)
-    cv2.grabCut(frame_bgr, grabcut_mask, None, bgd_model, fgd_model,
-                5, mode=cv2.GC_INIT_WITH_MASK)
+    grabcut_mask = np.pad(np.full((h - 2 * border, w - 2 * border), cv2.GC_PR_FGD, dtype=np.uint8),
+                          border, constant_values=cv2.GC_BGD)
+    grabcut_mask[initial_bg == 1] = cv2.GC_BGD                     # sure background
 
-    mask_fg = np.where((grabcut_mask == cv2.GC_FGD) | (grabcut_mask == cv2.GC_PR_FGD),
-                       1, 0).astype(np.uint8)
-    mask_fg = cv2.morphologyEx(mask_fg, cv2.MORPH_CLOSE, kernel, iterations=2)
+    # Step 3: GrabCut refinement, only for frames with ambiguous pixels
+    ambiguous = np.count_nonzero((green_excess > margin) & (green_excess <= AMBIGUOUS_GREEN))
+    if ambiguous < AMBIGUOUS_FRACTION * h * w:
+        mask_fg = (grabcut_mask == cv2.GC_PR_FGD).view(np.uint8)
+    else:
+        mask_fg = _grabcut_half_res(frame_bgr, grabcut_mask)
+    mask_fg = cv2.morphologyEx(mask_fg, cv2.MORPH_CLOSE, ELLIPSE_KERNEL, iterations=2)
 
-    alpha = (mask_fg * 255).astype(np.uint8)
-    rgba = cv2.cvtColor(frame_bgr, cv2.COLOR_BGR2BGRA)
-    rgba[:, :, 3] = alpha
-    return rgba
+    alpha = mask_fg * np.uint8(255)
+    return bgra_with_alpha(frame_bgr, alpha)
 
 # ──────────────────────────────────────────────────────────────────────
 #  Background-subtractor-based removal (for video sequences)
@@ -96,14 +179,10 @@ def greenscreen_remove_bg_subtractor(frame_bgr: np.ndarray) -> np.ndarray:
     subtractor = _lazy_subtractor()
     fg_mask = subtractor.apply(frame_bgr)
 
-    # Clean up the mask
-    _, fg_mask = cv2.threshold(fg_mask, 200, 255, cv2.THRESH_BINARY)
-    kernel = cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (3, 3))
-    fg_mask = cv2.morphologyEx(fg_mask, cv2.MORPH_OPEN, kernel, iterations=2)
+    # Clean up the mask (detectShadows=False, so MOG2 already emits only 0/255)
+    fg_mask = cv2.morphologyEx(fg_mask, cv2.MORPH_OPEN, ELLIPSE_KERNEL, iterations=2)
 
-    rgba = cv2.cvtColor(frame_bgr, cv2.COLOR_BGR2BGRA)
-    rgba[:, :, 3] = fg_mask.astype(np.uint8)
-    return rgba
+    return bgra_with_alpha(frame_bgr, fg_mask)
 
 # ──────────────────────────────────────────────────────────────────────
 #  Public registry helpers
@@ -111,6 +190,7 @@ def greenscreen_remove_bg_subtractor(frame_bgr: np.ndarray) -> np.ndarray:
 
 METHODS = {
     "simple": greenscreen_remove_simple,
+    "hsv": greenscreen_remove_hsv,
     "segment": greenscreen_remove_segmentation,
     "bgsub": greenscreen_remove_bg_subtractor,
 }
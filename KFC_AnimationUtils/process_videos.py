@@ -2,14 +2,19 @@
 """process_videos.py
 
 Utility script that scans `videos/` for media files and, for each video that
-does NOT already have a corresponding folder in `frames/`, runs the two helper
-scripts:
+does NOT already have a corresponding folder in `sprites/`, runs the two
+helper stages in-process:
 
 1. remove_green_screen_simple.py – extracts frames while removing the green
    background.
 2. frames_to_sprites.py – converts those extracted frames into cropped,
    resized sprite PNGs.
 
+The extracted frames are handed to the second stage in memory, so no
+intermediate PNGs are written and decoded again.
+
+Videos are processed in parallel by a process pool (see ``MAX_WORKERS``).
+
 Usage:
     python process_videos.py
 
@@ -18,10 +23,13 @@ anywhere within the project – it uses paths relative to this file).
 """
 from __future__ import annotations
 
-import subprocess
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Sequence
+
+from frames_to_sprites import frames_to_sprites_inmemory
+from remove_green_screen_simple import extract_rgba_frames
 
 
 # ---------------------------------------------------------------------------
@@ -29,81 +37,50 @@ from typing import Sequence
 # ---------------------------------------------------------------------------
 THIS_DIR = Path(__file__).resolve().parent
 VIDEOS_DIR = THIS_DIR / "videos"
-FRAMES_ROOT = THIS_DIR / "frames"
 SPRITES_ROOT = THIS_DIR / "sprites"
 
 # Video file extensions we care about
 VIDEO_EXTS = {".mp4", ".mov", ".avi", ".mkv"}
 
+# Videos are independent, so they are processed concurrently.  Decoding is
+# CPU-heavy, hence only half of the cores are used.
+MAX_WORKERS = max(1, (os.cpu_count() or 2) // 2)
+
 
 # ---------------------------------------------------------------------------
 # Helper functions
 # ---------------------------------------------------------------------------
 
-def run(cmd: Sequence[str]) -> int:
-    """Run *cmd* via subprocess and stream output. Returns the exit code."""
-    print("\n$", " ".join(cmd))
-    try:
-        return subprocess.call(cmd)
-    except KeyboardInterrupt:
-        print("\nInterrupted by user. Aborting current command…", file=sys.stderr)
-        return 130  # Standard interrupt exit code
-
-
 def process_video(video_path: Path) -> None:
-    """Process a single *video_path* through the two helper scripts."""
+    """Process a single *video_path* through the two helper stages."""
     base_name = video_path.stem  # file name without extension
 
-    frames_out = FRAMES_ROOT / base_name
     sprites_out = SPRITES_ROOT / base_name
 
-    # Skip if frames already extracted
-    if frames_out.exists():
-        print(f"Skipping {video_path.name} — frames already exist at '{frames_out}'.")
+    # Skip if sprites already generated
+    if sprites_out.exists():
+        print(f"Skipping {video_path.name} — sprites already exist at '{sprites_out}'.")
         return
 
     print("Processing", video_path.name)
 
-    # Ensure parent directories exist
-    FRAMES_ROOT.mkdir(exist_ok=True)
+    # Ensure parent directory exists
     SPRITES_ROOT.mkdir(exist_ok=True)
 
     # 1. Remove green screen / extract frames
-    rc = run(
-        [
-            sys.executable,
-            "remove_green_screen_simple.py",
-            "--video",
-            str(video_path),
-            "--diff_thresh",
-            "1",
-            "--step",
-            "3",
-            "--out",
-            str(frames_out),
-        ]
-    )
-    if rc != 0:
-        print(f"[ERROR] Green-screen removal failed for {video_path.name} (exit code {rc}). Skipping…")
+    try:
+        frames = extract_rgba_frames(str(video_path), diff_thresh=1, step=3)
+    except Exception as exc:
+        print(f"[ERROR] Green-screen removal failed for {video_path.name} ({exc}). Skipping…")
         return
 
     # 2. Convert frames to sprites
-    rc = run(
-        [
-            sys.executable,
-            "frames_to_sprites.py",
-            "--frames",
-            str(frames_out),
-            "--out",
-            str(sprites_out),
-            "--dstH",
-            "128",
-            "--dstW",
-            "128",
-        ]
-    )
-    if rc != 0:
-        print(f"[ERROR] Sprite conversion failed for {video_path.name} (exit code {rc}).")
+    try:
+        frames_to_sprites_inmemory(frames, sprites_out, 128, 128)
+    except Exception as exc:
+        print(f"[ERROR] Sprite conversion failed for {video_path.name} ({exc}).")
+        return
+    print(f"Processed {len(frames)} frames → {sprites_out}")
 
 
 # ---------------------------------------------------------------------------
@@ -120,8 +97,9 @@ def main() -> None:
         print("No video files found in", VIDEOS_DIR)
         return
 
-    for video in videos:
-        process_video(video)
+    with ProcessPoolExecutor(max_workers=min(MAX_WORKERS, len(videos))) as pool:
+        # Consume the iterator so worker exceptions are raised here
+        list(pool.map(process_video, videos))
 
 
 if __name__ == "__main__":
@@ -2,30 +2,87 @@ import cv2
 import numpy as np
 from pathlib import Path
 import argparse
-from greenscreen_removal_methods import get_method, METHODS
+import queue
+import threading
+from typing import Iterator, List, Optional, Tuple
+from greenscreen_removal_methods import bgra_with_alpha, get_method, green_alpha, METHODS
 
-GREEN_KERNEL = np.ones((3, 3), np.uint8)
+# Fast PNG encoding (deflate level 1); frames are intermediate output
+PNG_WRITE_PARAMS = [cv2.IMWRITE_PNG_COMPRESSION, 1]
 
-def greenscreen_remove(frame_bgr: np.ndarray) -> np.ndarray:
-    """Return an RGBA image with green pixels made fully transparent."""
-    B, G, R = [c.astype(np.float32) for c in cv2.split(frame_bgr)]
-    green_thresh = np.minimum(R + 0.5 * B, 0.5 * R + B)
-    mask = (G > green_thresh).astype(np.uint8)
-    mask = cv2.dilate(mask, GREEN_KERNEL, iterations=1)
-    alpha = np.where(mask > 0, 0, 255).astype(np.uint8)
+# Every N-th row/column is compared by the early-stop test
+EARLY_STOP_STRIDE = 8
 
-    rgba = cv2.cvtColor(frame_bgr, cv2.COLOR_BGR2BGRA)
-    rgba[:, :, 3] = alpha
-    return rgba
-
-def process_video(video_path: str,
-                  output_dir: str,
-                  method: str = "simple",
-                  start_sec: float = 0.0,
-                  diff_thresh: float = 2.0,
-                  invert: bool = False,
-                  step: int = 1):
+# Number of decoded frames buffered ahead of the chroma-key stage
+DECODE_AHEAD = 8
 
+def greenscreen_remove(frame_bgr: np.ndarray) -> np.ndarray:
+    """Return an RGBA image with green pixels made fully transparent."""
+    return bgra_with_alpha(frame_bgr, green_alpha(frame_bgr))
+
+def _decode_ahead(cap: cv2.VideoCapture, step: int, need_all: bool) -> Iterator[Tuple[bool, np.ndarray]]:
+    """Yield ``(keep, frame)`` for the frames after the current position of *cap*.
+
+    *keep* marks every *step*-th frame; the others are only decoded into BGR
+    when *need_all* is set.  Decoding runs on a background thread (OpenCV
+    releases the GIL), so it overlaps with the chroma keying of the caller.
+    """
+    frames: "queue.Queue[Optional[Tuple[bool, np.ndarray]]]" = queue.Queue(DECODE_AHEAD)
+    stop = threading.Event()
+
+    def put(item) -> bool:
+        while not stop.is_set():
+            try:
+                frames.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def decode():
+        frame_idx = 1  # count of processed frames (for step logic)
+        try:
+            while not stop.is_set():
+                # grab() only advances the decoder; the BGR conversion in
+                # retrieve() is paid just for frames that are actually looked at
+                if not cap.grab():
+                    break
+
+                frame_idx += 1
+                keep = (frame_idx - 1) % step == 0      # (frame 2 is idx 1, etc.)
+                if not (keep or need_all):
+                    continue
+
+                ret, frame = cap.retrieve()
+                if not ret or not put((keep, frame)):
+                    break
+        finally:
+            put(None)
+
+    worker = threading.Thread(target=decode, daemon=True)
+    worker.start()
+    try:
+        while True:
+            item = frames.get()
+            if item is None:
+                print("Reached end‑of‑file.")
+                return
+            yield item
+    finally:
+        stop.set()
+        worker.join()
+
+def iter_rgba_frames(video_path: str,
+                     method: str = "simple",
+                     start_sec: float = 0.0,
+                     diff_thresh: float = 2.0,
+                     invert: bool = False,
+                     step: int = 1) -> Iterator[np.ndarray]:
+    """Yield the greenscreen-removed BGRA frames of *video_path*.
+
+    The first frame (after *start_sec*) is always yielded, then every
+    *step*-th frame until end-of-file or the early-stop test fires.
+    """
     if step < 1:
         raise ValueError("--step must be ≥ 1")
 
@@ -33,55 +90,74 @@ def process_video(video_path: str,
     if not cap.isOpened():
         raise IOError(f"Cannot open video: {video_path}")
 
-    fps = cap.get(cv2.CAP_PROP_FPS) or 30  # use 30 fps fallback if 0
-    start_frame = int(round(start_sec * fps))
-    if start_frame:
-        cap.set(cv2.CAP_PROP_POS_FRAMES, start_frame)
-
-    # Select the requested greenscreen-removal function once per video
-    removal_fn = get_method(method)
+    try:
+        fps = cap.get(cv2.CAP_PROP_FPS) or 30  # use 30 fps fallback if 0
+        start_frame = int(round(start_sec * fps))
+        if start_frame:
+            cap.set(cv2.CAP_PROP_POS_FRAMES, start_frame)
 
-    # reference frame = first frame after any skip
-    ret, ref_frame = cap.read()
-    if not ret:
-        raise RuntimeError(f"Failed to read frame at t={start_sec}s")
+        # Select the requested greenscreen-removal function once per video
+        removal_fn = get_method(method)
 
-    Path(output_dir).mkdir(exist_ok=True)
-    out_idx = 1  # numbering of written files
-    frame_idx = 1  # count of processed frames (for step logic)
-
-    def maybe_save(img_bgr):
-        nonlocal out_idx
-        img_rgba = removal_fn(img_bgr)
-        if invert:
-            img_rgba[:, :, :3] = 255 - img_rgba[:, :, :3]
-        cv2.imwrite(f"{output_dir}/{out_idx}.png", img_rgba)
-        out_idx += 1
+        def extract(img_bgr):
+            img_rgba = removal_fn(img_bgr)
+            if invert:
+                img_rgba[:, :, :3] = 255 - img_rgba[:, :, :3]
+            return img_rgba
 
-    # save reference frame (always)
-    maybe_save(ref_frame)
-
-    while True:
-        ret, frame = cap.read()
+        # reference frame = first frame after any skip
+        ret, ref_frame = cap.read()
         if not ret:
-            print("Reached end‑of‑file.")
-            break
-
-        # early‑stop test (compare every frame, even if not saved)
-        if cv2.absdiff(frame, ref_frame).mean() <= diff_thresh and diff_thresh > 30:
-            print(f"Stopping: current frame similar to first (≤ {diff_thresh}).")
-            break
+            raise RuntimeError(f"Failed to read frame at t={start_sec}s")
+
+        # reference frame is always kept
+        yield extract(ref_frame)
+
+        # early-stop is only active for large thresholds; it compares a
+        # strided subsample, which is plenty for a scene-similarity test
+        early_stop = diff_thresh > 30
+        ref_sample = ref_frame[::EARLY_STOP_STRIDE, ::EARLY_STOP_STRIDE]
+
+        for keep, frame in _decode_ahead(cap, step, early_stop):
+            # early‑stop test (compare every frame, even if not saved)
+            if early_stop:
+                sample = frame[::EARLY_STOP_STRIDE, ::EARLY_STOP_STRIDE]
+                if cv2.absdiff(sample, ref_sample).mean() <= diff_thresh:
+                    print(f"Stopping: current frame similar to first (≤ {diff_thresh}).")
+                    break
+
+            # keep only every K‑th frame
+            if keep:
+                yield extract(frame)
+    finally:
+        cap.release()
+
+def extract_rgba_frames(video_path: str, **kwargs) -> List[np.ndarray]:
+    """Return all frames of :func:`iter_rgba_frames` as an in-memory list."""
+    return list(iter_rgba_frames(video_path, **kwargs))
 
-        # save only every K‑th frame
-        frame_idx += 1
-        if (frame_idx - 1) % step == 0:         # (frame 2 is idx 1, etc.)
-            maybe_save(frame)
+def process_video(video_path: str,
+                  output_dir: str,
+                  method: str = "simple",
+                  start_sec: float = 0.0,
+                  diff_thresh: float = 2.0,
+                  invert: bool = False,
+                  step: int = 1):
 
+    Path(output_dir).mkdir(exist_ok=True)
+    out_idx = 0  # numbering of written files
+    for img_rgba in iter_rgba_frames(video_path,
+                                     method=method,
+                                     start_sec=start_sec,
+                                     diff_thresh=diff_thresh,
+                                     invert=invert,
+                                     step=step):
+        out_idx += 1
+        cv2.imwrite(f"{output_dir}/{out_idx}.png", img_rgba, PNG_WRITE_PARAMS)
         if out_idx % 50 == 0:
             print(f"Saved {out_idx} frames...")
 
-    cap.release()
-    print(f"Done! Saved {out_idx-1} frames to '{output_dir}'")
+    print(f"Done! Saved {out_idx} frames to '{output_dir}'")
 
 # ────────────────────────────── CLI ──────────────────────────────────
 if __name__ == "__main__":
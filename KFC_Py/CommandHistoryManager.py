@@ -1,4 +1,6 @@
-from queue import Queue
+import io
+from collections import deque
+from functools import lru_cache
 from typing import List, Dict, Tuple, Optional
 from datetime import datetime
 from Command import Command
@@ -6,6 +8,26 @@ from Subscriber import Subscriber
 from EventType import EventType
 from MessageBroker import MessageBroker
 
+# Readable names of the piece-type letters (first character of a piece id)
+_PIECE_NAMES = {
+    "K": "King",
+    "Q": "Queen",
+    "R": "Rook",
+    "B": "Bishop",
+    "N": "Knight",
+    "P": "Pawn"
+}
+
+
+@lru_cache(maxsize=4096)
+def _format_elapsed(total_seconds: int) -> str:
+    """Format elapsed whole seconds as HH:MM:SS (cached, moves cluster in time)."""
+    hours = total_seconds // 3600
+    minutes = (total_seconds % 3600) // 60
+    seconds = total_seconds % 60
+    return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+
+
 class CommandHistoryManager(Subscriber):
     """
     Class for managing command history for a single player.
@@ -22,8 +44,11 @@ class CommandHistoryManager(Subscriber):
         """
         self.player_color = player_color
         self.broker = broker
-        self.command_history: Queue = Queue()
-        self.formatted_history: List[Dict[str, str]] = []
+        self.command_history: deque = deque()
+        # Compact (timestamp_ms, piece_id, type, params) entries, formatted on demand
+        self.formatted_history: List[Tuple[int, str, str, tuple]] = []
+        # Bumped on every change, lets readers cache what they derive from it
+        self.version = 0
         
         # Subscribe to piece movement events
         self.broker.subscribe(EventType.PIECE_MOVED, self)
@@ -66,15 +91,13 @@ class CommandHistoryManager(Subscriber):
             command: Command to add
         """
         # Add to queue
-        self.command_history.put(command)
-        
-        # Create textual description of command, including the timestamp
-        description = self._format_command_description_with_time(command)
+        self.command_history.append(command)
         
-        # Add to formatted list
-        self.formatted_history.append({
-            "description": description
-        })
+        # Keep only the command parts; the description is formatted when read
+        self.formatted_history.append(
+            (command.timestamp, command.piece_id, command.type, tuple(command.params))
+        )
+        self.version += 1
     
     def _format_command_description_with_time(self, command: Command) -> str:
         """
@@ -86,28 +109,44 @@ class CommandHistoryManager(Subscriber):
         Returns:
             Textual description of command with timestamp (e.g. "HH:MM:SS King: (x,y) -> (x,y)")
         """
-        time_str = self._format_timestamp(command.timestamp)
-        piece_type = self._get_piece_type_name(command.piece_id)
+        return self._format_entry(command.timestamp, command.piece_id,
+                                  command.type, command.params)
+
+    def _format_entry(self, timestamp_ms: int, piece_id: str, cmd_type: str, params) -> str:
+        """
+        Create textual description of a stored history entry, with timestamp.
         
-        if command.type == "move" and len(command.params) >= 2:
-            from_pos = command.params[0]
-            to_pos = command.params[1]
+        Args:
+            timestamp_ms: Command time in milliseconds from game start
+            piece_id: Piece identifier
+            cmd_type: Command type ("move", "jump", ...)
+            params: Command parameters
+            
+        Returns:
+            Textual description of command with timestamp
+        """
+        time_str = self._format_timestamp(timestamp_ms)
+        piece_type = self._get_piece_type_name(piece_id)
+        
+        if cmd_type == "move" and len(params) >= 2:
+            from_pos = params[0]
+            to_pos = params[1]
             return f"{time_str} {piece_type}: {from_pos} -> {to_pos}"
-        elif command.type == "jump":
-            if len(command.params) >= 2:
+        elif cmd_type == "jump":
+            if len(params) >= 2:
                 # Jump with from -> to positions
-                from_pos = command.params[0]
-                to_pos = command.params[1]
+                from_pos = params[0]
+                to_pos = params[1]
                 return f"{time_str} {piece_type}: jump {from_pos} -> {to_pos}"
-            elif len(command.params) >= 1:
+            elif len(params) >= 1:
                 # Jump with only current position
-                pos = command.params[0]
+                pos = params[0]
                 return f"{time_str} {piece_type}: jump at {pos}"
             else:
                 # Jump without position info
                 return f"{time_str} {piece_type}: jump"
         else:
-            return f"{time_str} {piece_type}: {command.type}"
+            return f"{time_str} {piece_type}: {cmd_type}"
 
     def _format_command_description(self, command: Command) -> str:
         """
@@ -151,20 +190,12 @@ class CommandHistoryManager(Subscriber):
         Returns:
             Piece name in English
         """
-        if len(piece_id) < 1:
+        if not piece_id:
             return "Unknown"
-            
+
         piece_type = piece_id[0]
-        type_names = {
-            "K": "King",
-            "Q": "Queen", 
-            "R": "Rook",
-            "B": "Bishop",
-            "N": "Knight",
-            "P": "Pawn"
-        }
-        
-        return type_names.get(piece_type, f"Piece {piece_type}")
+        name = _PIECE_NAMES.get(piece_type)
+        return name if name is not None else f"Piece {piece_type}"
     
     def _format_timestamp(self, timestamp_ms: int) -> str:
         """
@@ -176,22 +207,8 @@ class CommandHistoryManager(Subscriber):
         Returns:
             Formatted time for display (HH:MM:SS showing elapsed time)
         """
-        # Convert timestamp to seconds - handle both positive and negative values
-        if timestamp_ms < 0:
-            # If negative, use absolute value
-            total_seconds = abs(timestamp_ms) // 1000
-        else:
-            total_seconds = timestamp_ms // 1000
-            
-        # Calculate hours, minutes, seconds from elapsed time
-        hours = total_seconds // 3600
-        minutes = (total_seconds % 3600) // 60
-        seconds = total_seconds % 60
-        
-        # Format as HH:MM:SS
-        time_str = f"{hours:02d}:{minutes:02d}:{seconds:02d}"
-        
-        return time_str
+        # Convert timestamp to seconds - negative values use their absolute value
+        return _format_elapsed(abs(timestamp_ms) // 1000)
     
     def get_formatted_history(self) -> List[str]:
         """
@@ -200,7 +217,21 @@ class CommandHistoryManager(Subscriber):
         Returns:
             List of commands with time and description
         """
-        return [entry['description'] for entry in self.formatted_history]
+        return [self._format_entry(*entry) for entry in self.formatted_history]
+    
+    def get_formatted_tail(self, n: int) -> List[str]:
+        """
+        Get the last *n* history entries, formatted (oldest first).
+        
+        Args:
+            n: Maximum number of entries to return
+            
+        Returns:
+            List of commands with time and description
+        """
+        # A tail slice copies only the n entries it keeps; only those are formatted
+        start = max(0, len(self.formatted_history) - n)
+        return [self._format_entry(*entry) for entry in self.formatted_history[start:]]
     
     def get_history_as_table(self) -> str:
         """
@@ -212,29 +243,31 @@ class CommandHistoryManager(Subscriber):
         if not self.formatted_history:
             return f"No history for player {self.player_color}"
         
-        # Table header
+        # Table header; rows go into one buffer instead of re-copying a growing string
         color_name = "White" if self.player_color == "W" else "Black"
-        table = f"Move History - {color_name} Player\n"
-        table += "=" * 50 + "\n"
-        table += f"{'Time':<8} | {'Move Description':<35}\n"
-        table += "-" * 50 + "\n"
+        table = io.StringIO()
+        table.write(f"Move History - {color_name} Player\n")
+        table.write("=" * 50 + "\n")
+        table.write(f"{'Time':<8} | {'Move Description':<35}\n")
+        table.write("-" * 50 + "\n")
         
         # Add rows
-        for entry in self.formatted_history:
-            table += f"{entry['description']}\n"
+        for description in self.get_formatted_history():
+            table.write(description)
+            table.write("\n")
         
-        return table
+        return table.getvalue()
     
     def clear_history(self):
         """
         Clear all history.
         """
         # Clear queue
-        while not self.command_history.empty():
-            self.command_history.get()
+        self.command_history.clear()
         
         # Clear formatted list
         self.formatted_history.clear()
+        self.version += 1
     
     def get_move_count(self) -> int:
         """
@@ -5,5 +5,7 @@ class EventType(Enum):
     GAME_END = "game_end"
     PIECE_MOVED = "piece_moved"
     PIECE_CAPTURED = "piece_captured"
+    PIECE_CAPTURED_BATCH = "piece_captured_batch"
     INVALID_MOVE = "invalid_move"
+    MESSAGE_DISMISSED = "message_dismissed"
     
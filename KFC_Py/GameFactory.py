@@ -1,6 +1,10 @@
+import functools
+import os
 import pathlib
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from Board import Board
-from PieceFactory import PieceFactory
+from PieceFactory import PieceFactory, PieceTemplate
 from Game import Game
 from GraphicsFactory import GraphicsFactory
 from GameUI import GameUI
@@ -11,9 +15,58 @@ from SoundManager import SoundManager
 from MessageDisplay import MessageDisplay
 
 CELL_PX = 64
+PIECE_LOAD_WORKERS = 8  # threads loading piece types (sprite decoding releases the GIL)
 
+# What create_game_with_history() builds; still unpacks like the old 6-tuple.
+# sound_manager / message_display are None when their subsystem is disabled.
+GameComponents = namedtuple(
+    "GameComponents",
+    "game ui history_display broker sound_manager message_display")
 
-def create_game(pieces_root: str | pathlib.Path, img_factory) -> Game:
+
+# Asset caches are keyed by the file's mtime so an edited file is reloaded
+@functools.lru_cache(maxsize=8)
+def _cached_board_layout(path: str, mtime_ns: int) -> tuple[tuple[str, tuple[int, int]], ...]:
+    # One bulk binary read; board.csv is plain ASCII, so a corrupt file fails
+    # loudly here. splitlines() drops "\n" and "\r\n" alike, no strip() needed
+    lines = pathlib.Path(path).read_bytes().decode("ascii").splitlines()
+    return tuple((code, (r, c))
+                 for r, line in enumerate(lines)
+                 for c, code in enumerate(line.split(","))
+                 if code)
+
+
+def _read_board_layout(board_csv: pathlib.Path) -> tuple[tuple[str, tuple[int, int]], ...]:
+    """Return ``(code, (row, col))`` for every occupied cell of *board_csv*."""
+    return _cached_board_layout(str(board_csv.resolve()), board_csv.stat().st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=8)
+def _cached_board_img(img_factory, path: str, mtime_ns: int, size: tuple[int, int]):
+    return img_factory(pathlib.Path(path), size, keep_aspect=False)
+
+
+def _load_board_img(img_factory, board_png: pathlib.Path, size: tuple[int, int]):
+    """Load *board_png* at *size*, decoding it only once per factory and file version."""
+    img = _cached_board_img(img_factory, str(board_png.resolve()), board_png.stat().st_mtime_ns, size)
+    return img.copy()  # each board gets its own pixels
+
+
+@functools.lru_cache(maxsize=4)
+def _cached_piece_templates(pieces_root: str, img_factory, codes: tuple[str, ...]) -> dict[str, PieceTemplate]:
+    # Templates only depend on the board geometry, which is fixed here, so a
+    # stand-in board is enough; pieces are bound to the real board on instantiate.
+    board = Board(CELL_PX, CELL_PX, 8, 8, None)
+    pf = PieceFactory(board, pathlib.Path(pieces_root), graphics_factory=GraphicsFactory(img_factory))
+
+    # Sprites are loaded once per piece type (e.g. once for all 8 white
+    # pawns); the loads are independent and mostly spent in cv2, so they
+    # overlap well on a thread pool
+    with ThreadPoolExecutor(max_workers=PIECE_LOAD_WORKERS) as ex:
+        return dict(zip(codes, ex.map(pf.build_template, codes)))
+
+
+def create_game(pieces_root: str | pathlib.Path, img_factory, **features) -> Game:
     """Build a *Game* from the on-disk asset hierarchy rooted at *pieces_root*.
 
     This reads *board.csv* located inside *pieces_root*, creates a blank board
@@ -22,15 +75,18 @@ def create_game(pieces_root: str | pathlib.Path, img_factory) -> Game:
     
     For backward compatibility, this returns only the Game object.
     Use create_game_with_history() for the full tuple with history management.
+    *features* are forwarded to it (e.g. ``enable_sound=False``).
     
     Returns:
         Game: The game instance
     """
-    game, ui, history_display, broker, sound_manager, message_display = create_game_with_history(pieces_root, img_factory)
-    return game
+    return create_game_with_history(pieces_root, img_factory, **features).game
 
 
-def create_game_with_history(pieces_root: str | pathlib.Path, img_factory) -> tuple:
+def create_game_with_history(pieces_root: str | pathlib.Path, img_factory, *,
+                             enable_sound: bool = True,
+                             enable_message_display: bool = True,
+                             player_names_manager: PlayerNamesManager = None) -> GameComponents:
     """Build a *Game* from the on-disk asset hierarchy rooted at *pieces_root*.
 
     This reads *board.csv* located inside *pieces_root*, creates a blank board
@@ -38,12 +94,45 @@ def create_game_with_history(pieces_root: str | pathlib.Path, img_factory) -> tu
     and returns a ready-to-run *Game* instance with history management, sound effects,
     and message display system.
     
+    Args:
+        enable_sound: Create a SoundManager for the game events
+        enable_message_display: Create the on-screen MessageDisplay
+        player_names_manager: Names manager to use; when omitted the players
+            are asked for their names through the GUI
+    
+    Returns:
+        GameComponents: (game, ui, history_display, broker, sound_manager, message_display)
+    """
+    pieces_root = pathlib.Path(pieces_root)
+    if player_names_manager is None:
+        # The names dialog waits on the players; load the assets meanwhile
+        # (the dialog itself stays on the calling thread, as GUI code must)
+        with ThreadPoolExecutor(max_workers=1) as ex:
+            prepared = ex.submit(prepare_game, pieces_root, img_factory)
+            player_names_manager = ask_player_names()
+            pieces, board = prepared.result()
+    else:
+        pieces, board = prepare_game(pieces_root, img_factory)
+
+    return assemble_game(pieces, board, pieces_root,
+                         enable_sound=enable_sound,
+                         enable_message_display=enable_message_display,
+                         player_names_manager=player_names_manager)
+
+
+def prepare_game(pieces_root: str | pathlib.Path, img_factory) -> tuple[list, Board]:
+    """Do all the disk work for a game: read the layout, board image and pieces.
+
     Returns:
-        tuple: (game, ui, history_display, broker, sound_manager, message_display)
+        tuple: (pieces, board)
     """
     pieces_root = pathlib.Path(pieces_root)
+    # One directory scan instead of an exists() stat per asset
+    with os.scandir(pieces_root) as it:
+        root_entries = {e.name for e in it}
+
     board_csv = pieces_root / "board.csv"
-    if not board_csv.exists():
+    if "board.csv" not in root_entries:
         raise FileNotFoundError(board_csv)
 
     # Try to load board.png for the actual board, background.jpg will be handled by GameUI
@@ -52,38 +141,48 @@ def create_game_with_history(pieces_root: str | pathlib.Path, img_factory) -> tu
     loader = img_factory
     
     # Load board image (the actual chess board, not the background)
-    if board_png.exists():
-        board_img = loader(board_png, (CELL_PX*8, CELL_PX*8), keep_aspect=False)
+    if "board.png" in root_entries:
+        board_img = _load_board_img(loader, board_png, (CELL_PX*8, CELL_PX*8))
     else:
         raise FileNotFoundError(f"Board image {board_png} not found")
 
     board = Board(CELL_PX, CELL_PX, 8, 8, board_img)
 
-    gfx_factory = GraphicsFactory(img_factory)
-    pf = PieceFactory(board, pieces_root, graphics_factory=gfx_factory)
+    layout = _read_board_layout(board_csv)
+    codes = tuple(dict.fromkeys(code for code, _ in layout))
+    templates = _cached_piece_templates(str(pieces_root.resolve()), img_factory, codes)
+    pieces = [templates[code].instantiate(cell, board) for code, cell in layout]
+
+    return pieces, board
+
+
+def ask_player_names() -> PlayerNamesManager:
+    """Ask the players for their names through the GUI and return the manager holding them."""
+    print("Welcome to KFC Chess!")
+    player_names_manager = PlayerNamesManager()
+    white_name, black_name = player_names_manager.get_player_names_from_gui()
+    print(f"Starting game: {white_name} (White) vs {black_name} (Black)")
+    return player_names_manager
+
 
-    pieces = []
-    with board_csv.open() as f:
-        for r, line in enumerate(f):
-            for c, code in enumerate(line.strip().split(",")):
-                if code:
-                    pieces.append(pf.create_piece(code, (r, c)))
+def assemble_game(pieces, board: Board, pieces_root: pathlib.Path, *,
+                  enable_sound: bool = True,
+                  enable_message_display: bool = True,
+                  player_names_manager: PlayerNamesManager = None) -> GameComponents:
+    """Wire already-built *pieces* and *board* into a game with its subsystems.
 
+    Only the subsystems whose flag is set are created; the UI creates a default
+    names manager when *player_names_manager* is None.
+    """
     # Create the game with history management system
     broker = MessageBroker()
     
     # Create sound manager with sounds from pieces/sound folder
-    sounds_folder = pieces_root / "sound"
-    sound_manager = SoundManager(broker, sounds_folder)
+    sound_manager = SoundManager(broker, pieces_root / "sound") if enable_sound else None
     
     # Create message display system
-    message_display = MessageDisplay(broker, screen_width=800, screen_height=600)
-    
-    # Get player names from user before creating the game
-    print("Welcome to KFC Chess!")
-    player_names_manager = PlayerNamesManager()
-    white_name, black_name = player_names_manager.get_player_names_from_gui()
-    print(f"Starting game: {white_name} (White) vs {black_name} (Black)")
+    message_display = (MessageDisplay(broker, screen_width=800, screen_height=600)
+                       if enable_message_display else None)
     
     # Create UI with broker and player names
     ui = GameUI(None, pieces_root, broker, player_names_manager)  # Pass the names manager
@@ -97,4 +196,4 @@ def create_game_with_history(pieces_root: str | pathlib.Path, img_factory) -> tu
     # Get history display from UI
     history_display = ui.history_display
     
-    return game, ui, history_display, broker, sound_manager, message_display
\ No newline at end of file
+    return GameComponents(game, ui, history_display, broker, sound_manager, message_display)
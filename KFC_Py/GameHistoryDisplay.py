@@ -1,10 +1,31 @@
-from typing import Dict, List, Optional
+import sys
+from functools import cached_property
+from typing import TYPE_CHECKING, Dict, List, NamedTuple
 from CommandHistoryManager import CommandHistoryManager
 from ScoreManager import ScoreManager
-from PlayerNamesManager import PlayerNamesManager
 from MessageBroker import MessageBroker
-from EventType import EventType
-from Command import Command
+
+if TYPE_CHECKING:  # imported at runtime only when a default is needed (pulls in cv2)
+    from PlayerNamesManager import PlayerNamesManager
+
+# Layout of a history panel: pixel height of one text line (matches the
+# line_height in GameUI.py) and lines kept for title, score and a margin
+HISTORY_LINE_HEIGHT_PX = 20
+HISTORY_RESERVED_LINES = 3
+
+
+class DisplayArea(NamedTuple):
+    """Pixel rectangle of one player's history panel."""
+    x: int
+    y: int
+    width: int
+    height: int
+
+
+def _max_move_lines(available_height: int) -> int:
+    """Number of move lines that fit in *available_height* pixels (at least one)."""
+    return max(1, available_height // HISTORY_LINE_HEIGHT_PX - HISTORY_RESERVED_LINES)
+
 
 class GameHistoryDisplay:
     """
@@ -12,7 +33,7 @@ class GameHistoryDisplay:
     Manages two CommandHistoryManager instances and displays information in UI.
     """
     
-    def __init__(self, broker: MessageBroker, player_names_manager: PlayerNamesManager = None):
+    def __init__(self, broker: MessageBroker, player_names_manager: "PlayerNamesManager" = None):
         """
         Initialize display manager.
         
@@ -29,22 +50,33 @@ class GameHistoryDisplay:
         # Create score manager
         self.score_manager = ScoreManager(broker)
         
-        # Create or use provided player names manager
-        self.player_names_manager = player_names_manager if player_names_manager else PlayerNamesManager()
+        # History and score managers stay eager: they must be subscribed before
+        # the first move/capture event. A provided player names manager is used
+        # as is; the default one is only built on first access.
+        if player_names_manager:
+            self.player_names_manager = player_names_manager
         
         # Display positions in interface (in pixels) - moved higher up
-        self.white_display_area = {
-            "x": 850,
-            "y": 20,  # Moved up from 50
-            "width": 300,
-            "height": 280
-        }
+        self.white_display_area = DisplayArea(x=850, y=20, width=300, height=280)    # y moved up from 50
+        self.black_display_area = DisplayArea(x=850, y=320, width=300, height=280)   # y moved up from 400
+        self._areas = {"W": self.white_display_area, "B": self.black_display_area}
         
-        self.black_display_area = {
-            "x": 850,
-            "y": 320,  # Moved up from 400
-            "width": 300, 
-            "height": 280
+        # Per player colour: (cache key, lines) of the last formatted display text
+        self._display_text_cache: Dict[str, tuple] = {}
+    
+    @cached_property
+    def player_names_manager(self) -> "PlayerNamesManager":
+        """Default player names manager, created on first use (loads cv2 and the background image)."""
+        from PlayerNamesManager import PlayerNamesManager
+        return PlayerNamesManager()
+    
+    @cached_property
+    def _by_color(self) -> Dict[str, tuple]:
+        """Per player colour: (history manager, name getter, score getter)."""
+        names = self.player_names_manager
+        return {
+            "W": (self.white_history, names.get_white_player_name, self.score_manager.get_white_score),
+            "B": (self.black_history, names.get_black_player_name, self.score_manager.get_black_score),
         }
     
     def get_white_player_history(self) -> List[str]:
@@ -74,52 +106,55 @@ class GameHistoryDisplay:
             available_height: Available height in pixels for displaying moves
             
         Returns:
-            List of text lines for display
+            List of text lines for display (cached between calls, do not modify)
         """
-        if player_color == "W":
-            history = self.white_history.get_formatted_history()
-            title = self.player_names_manager.get_white_player_name()
-            score = self.score_manager.get_white_score()
-        else:
-            history = self.black_history.get_formatted_history()
-            title = self.player_names_manager.get_black_player_name()
-            score = self.score_manager.get_black_score()
+        history_manager, name_fn, score_fn = self._by_color[player_color]
+        title = name_fn()
+        score = score_fn()
+        
+        # The UI asks every frame; reformat only when an input has changed
+        key = (available_height, history_manager.version, title, score)
+        cached = self._display_text_cache.get(player_color)
+        if cached is not None and cached[0] == key:
+            return cached[1]
         
+        lines = self._build_display_text(history_manager, title, score, available_height)
+        self._display_text_cache[player_color] = (key, lines)
+        return lines
+    
+    def _build_display_text(self, history_manager: CommandHistoryManager, title: str,
+                            score: int, available_height: int) -> List[str]:
+        """Lay out the title, the most recent moves that fit, and the score."""
         # Just the player name without "Moves:"
         lines = [title]
         
-        if not history:
+        move_count = history_manager.get_move_count()
+        if not move_count:
             # Return title and score when no moves yet
             lines.append(f"Score: {score}")
             return lines
         
         # Calculate how many moves can fit in the display area dynamically
-        # Assume each line takes about 20 pixels (matching GameUI.py), and we need space for title and score (2 lines)
-        lines_per_pixel = 20  # Match the line_height in GameUI.py
-        reserved_lines = 3  # title, score, and some margin - increased from 2 to 3
-        max_lines_for_moves = max(1, (available_height // lines_per_pixel) - reserved_lines)
-        
-        # Show recent moves (dynamic based on available space)
-        recent_moves = history[-max_lines_for_moves:] if len(history) > max_lines_for_moves else history
-        
-        for i, move_description in enumerate(recent_moves, 1):
-            # If we're showing truncated history, adjust numbering
-            if len(history) > max_lines_for_moves:
-                move_number = len(history) - max_lines_for_moves + i
-            else:
-                move_number = i
+        max_lines_for_moves = _max_move_lines(available_height)
+        
+        # Show recent moves (dynamic based on available space); only those are formatted
+        recent_moves = history_manager.get_formatted_tail(max_lines_for_moves)
+        
+        # Number the moves by their position in the full history
+        first_move_number = move_count - len(recent_moves) + 1
+        for move_number, move_description in enumerate(recent_moves, first_move_number):
             lines.append(f"{move_number:2d}. {move_description}")
         
         # Add indication if there are more moves (only if truncated)
-        if len(history) > max_lines_for_moves:
-            lines.append(f"... and {len(history) - max_lines_for_moves} more moves")
+        if move_count > max_lines_for_moves:
+            lines.append(f"... and {move_count - max_lines_for_moves} more moves")
         
         # Add score at the bottom
         lines.append(f"Score: {score}")
         
         return lines
     
-    def get_display_area(self, player_color: str) -> Dict[str, int]:
+    def get_display_area(self, player_color: str) -> DisplayArea:
         """
         Get display area for specific player.
         
@@ -127,12 +162,9 @@ class GameHistoryDisplay:
             player_color: Player color ("W" or "B")
             
         Returns:
-            Dictionary with area position and dimensions
+            Immutable DisplayArea with area position and dimensions
         """
-        if player_color == "W":
-            return self.white_display_area.copy()
-        else:
-            return self.black_display_area.copy()
+        return self._areas[player_color]
     
     def get_move_counts(self) -> Dict[str, int]:
         """
@@ -182,24 +214,27 @@ class GameHistoryDisplay:
         self.white_history.clear_history()
         self.black_history.clear_history()
         self.score_manager.reset_scores()
+        self._display_text_cache.clear()
     
     def print_full_history(self):
         """
         Print full history of both players to console with scores.
         """
-        print("\n" + "="*60)
-        print("Complete Game History")
-        print("="*60)
-        
         scores = self.get_scores()
+        counts = self.get_move_counts()
         white_name = self.player_names_manager.get_white_player_name()
         black_name = self.player_names_manager.get_black_player_name()
-        print(f"\nScores: {white_name} {scores['white']} - {scores['black']} {black_name}")
         
-        print("\n" + self.white_history.get_history_as_table())
-        print("\n" + self.black_history.get_history_as_table())
-        
-        counts = self.get_move_counts()
-        print(f"\nSummary: {white_name} - {counts['white']} moves ({scores['white']} points)")
-        print(f"         {black_name} - {counts['black']} moves ({scores['black']} points)")
-        print("="*60)
+        # Built up front and written in one go rather than line by line
+        parts = [
+            "\n" + "="*60,
+            "Complete Game History",
+            "="*60,
+            f"\nScores: {white_name} {scores['white']} - {scores['black']} {black_name}",
+            "\n" + self.white_history.get_history_as_table(),
+            "\n" + self.black_history.get_history_as_table(),
+            f"\nSummary: {white_name} - {counts['white']} moves ({scores['white']} points)",
+            f"         {black_name} - {counts['black']} moves ({scores['black']} points)",
+            "="*60,
+        ]
+        sys.stdout.write("\n".join(parts) + "\n")
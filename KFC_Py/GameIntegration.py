@@ -9,6 +9,7 @@ from GameUI import GameUI
 from GameHistoryDisplay import GameHistoryDisplay
 from PlayerNamesManager import PlayerNamesManager
 from MessageBroker import MessageBroker
+from GameFactory import assemble_game
 from Board import Board
 from Piece import Piece
 from typing import List
@@ -26,21 +27,9 @@ def create_game_with_history(pieces: List[Piece], board: Board, pieces_folder: p
     Returns:
         tuple containing game, UI, history manager and message broker
     """
-    # Create central MessageBroker
-    broker = MessageBroker()
-    
-    # Create UI with broker
-    ui = GameUI(None, pieces_folder, broker)  # Pass None for game temporarily
-    
-    # Create game with broker and UI
-    game = Game(pieces, board, broker, ui)
-    
-    # Set game reference in UI
-    ui.game = game
-    
-    # Get history display from UI
-    history_display = ui.history_display
-    
+    # Same wiring as GameFactory, without the sound and message subsystems
+    game, ui, history_display, broker, _, _ = assemble_game(
+        pieces, board, pieces_folder, enable_sound=False, enable_message_display=False)
     return game, ui, history_display, broker
 
 
@@ -1,6 +1,9 @@
+import functools
 import pathlib
 import cv2
-from typing import Dict, List, Tuple, Optional
+import numpy as np
+from collections import deque
+from typing import Deque, Dict, List, Tuple, Optional
 from img import Img
 from Board import Board
 from Game import Game
@@ -13,6 +16,17 @@ import logging
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=64)
+def _text_size(text: str, font: int, font_scale: float, thickness: int):
+    """cv2.getTextSize, memoised: an on-screen message is re-measured on every frame it shows."""
+    return cv2.getTextSize(text, font, font_scale, thickness)
+
+
+def _poll_key() -> int:
+    poll_key = getattr(cv2, "pollKey", None)
+    return poll_key() if poll_key is not None else cv2.waitKey(1)
+
+
 class GameUI:
     """
     Enhanced Game UI class that handles the visual display of the chess game
@@ -38,8 +52,8 @@ class GameUI:
         self.sidebar_width = 280  # Width for scores and moves display - reduced for better fit
         
         # Player data for UI display
-        self.player1_moves: List[str] = []
-        self.player2_moves: List[str] = []
+        self.player1_moves: Deque[str] = deque(maxlen=10)
+        self.player2_moves: Deque[str] = deque(maxlen=10)
         self.player1_score: int = 0
         self.player2_score: int = 0
         
@@ -50,8 +64,32 @@ class GameUI:
         self.player2_color = (255, 0, 0)  # Blue for player 2 (BGR)
         self.panel_color = (60, 60, 60)  # Lighter gray for panels
         
+        # (message, stamp) of the last message box drawn by _draw_message_overlay
+        self._message_stamp_cache = None
+        
+        # Last key read by pump_events (-1 when none)
+        self._last_key = -1
+        
         self._load_background()
         self._initialize_ui()
+        self._compute_layout()
+    
+    def _compute_layout(self):
+        """Work out where the board and side panels go; the window size is fixed, so once is enough."""
+        # Place the game board in the center
+        self._board_x = (self.ui_width - self.board_size) // 2
+        self._board_y = (self.ui_height - self.board_size) // 2
+        
+        # Left panel - centered in the space between left edge and board
+        left_panel_width = self._board_x - 40  # Leave 20px margin on each side
+        self._left_panel_x = (self._board_x - left_panel_width) // 2
+        
+        # Right panel - centered in the space between board and right edge
+        right_space_width = self.ui_width - (self._board_x + self.board_size) - 40  # Leave 20px margin on each side
+        self._right_panel_x = self._board_x + self.board_size + (right_space_width - 250) // 2 + 20  # 250 is approx panel width
+        
+        # Position panels below the player names
+        self._panel_start_y = self._board_y + 50
     
     def _load_background(self):
         """Load and resize the background image to fit the board."""
@@ -76,43 +114,45 @@ class GameUI:
         """Create a default background if the image file is not found."""
         self.background_img = Img()
         # Create a simple checkered pattern as default
-        import numpy as np
         default_bg = np.zeros((self.board_size, self.board_size, 3), dtype=np.uint8)
         
-        # Create checkered pattern
+        # Create checkered pattern: pick a colour per square, then expand each
+        # square to cell_size x cell_size pixels in one go
         cell_size = self.board_size // 8
-        for row in range(8):
-            for col in range(8):
-                if (row + col) % 2 == 0:
-                    color = (240, 217, 181)  # Light squares
-                else:
-                    color = (181, 136, 99)   # Dark squares
-                
-                y1 = row * cell_size
-                y2 = (row + 1) * cell_size
-                x1 = col * cell_size
-                x2 = (col + 1) * cell_size
-                
-                default_bg[y1:y2, x1:x2] = color
+        light = np.array((240, 217, 181), dtype=np.uint8)  # Light squares
+        dark = np.array((181, 136, 99), dtype=np.uint8)    # Dark squares
+        is_dark = (np.add.outer(np.arange(8), np.arange(8)) & 1).astype(bool)
+        squares = np.where(is_dark[..., None], dark, light)
+        pattern = squares.repeat(cell_size, axis=0).repeat(cell_size, axis=1)
+        default_bg[:pattern.shape[0], :pattern.shape[1]] = pattern
         
         self.background_img.img = default_bg
         logger.info("Created default checkered background")
     
     def _initialize_ui(self):
         """Initialize the complete UI layout."""
-        # Create the main UI canvas with background image covering the entire window
-        import numpy as np
-        self.ui_canvas = np.zeros((self.ui_height, self.ui_width, 3), dtype=np.uint8)
-        
-        # Fill the entire canvas with the background image
+        # The background never changes, so it is scaled to the full window once
+        # here and each frame starts from a plain copy of it
         if self.background_img and self.background_img.img is not None:
             # Resize background to fit the entire UI canvas
-            bg_resized = cv2.resize(self.background_img.img, (self.ui_width, self.ui_height))
-            self.ui_canvas = bg_resized.copy()
+            self._bg_cached = cv2.resize(self.background_img.img, (self.ui_width, self.ui_height))
         else:
             # Fallback to dark background if no background image
-            self.ui_canvas = np.full((self.ui_height, self.ui_width, 3), 
-                                    self.bg_color, dtype=np.uint8)
+            self._bg_cached = np.full((self.ui_height, self.ui_width, 3), 
+                                      self.bg_color, dtype=np.uint8)
+        
+        # The main UI canvas, allocated once and redrawn in place every frame
+        self.ui_canvas = self._bg_cached.copy()
+        
+        # Background plus all text that only changes between moves (see render_complete_ui)
+        self._static_layer = self._bg_cached.copy()
+        self._static_key = None
+        
+        # Canvas region the last message box was blended into, if any
+        self._message_roi = None
+        
+        # Scaled RGBA board, reused every frame before its conversion to RGB
+        self._board_rgba = np.empty((self.board_size, self.board_size, 4), dtype=np.uint8)
         
         # Draw the main panels
         self._draw_ui_panels()
@@ -131,51 +171,30 @@ class GameUI:
     
     def _overlay_board_on_background(self, background, board):
         """Overlay the board content on the background, showing board only where there's actual content."""
-        import numpy as np
-        
-        # Convert images to proper format for processing
-        bg = background.astype(np.float32)
-        board_img = board.astype(np.float32)
-        
+        # Everything stays uint8: two single-channel thresholds and one masked copy
         # Create a mask to detect where the board has actual content
         # We'll consider pixels that are significantly different from black as "content"
-        gray_board = cv2.cvtColor(board.astype(np.uint8), cv2.COLOR_BGR2GRAY)
-        
-        # Create a mask for board content:
-        # - Chess pieces (usually colorful and bright)
-        # - Board lines and elements
-        # - Anything that's not pure black or very dark
-        content_mask = gray_board > 15  # Threshold for detecting content
+        gray_board = cv2.cvtColor(board, cv2.COLOR_BGR2GRAY)
+        _, content_mask = cv2.threshold(gray_board, 15, 255, cv2.THRESH_BINARY)
         
         # Also detect areas with color variations (not pure black/dark)
         # This helps detect subtle board elements
-        hsv_board = cv2.cvtColor(board.astype(np.uint8), cv2.COLOR_BGR2HSV)
-        saturation = hsv_board[:, :, 1]
-        color_mask = saturation > 10  # Areas with some color
+        saturation = cv2.cvtColor(board, cv2.COLOR_BGR2HSV)[:, :, 1]
+        _, color_mask = cv2.threshold(saturation, 10, 255, cv2.THRESH_BINARY)
         
         # Combine masks: show board where there's content OR color
-        final_mask = np.logical_or(content_mask, color_mask)
-        
-        # Convert to 3-channel mask
-        mask_3d = np.stack([final_mask, final_mask, final_mask], axis=-1)
-        
-        # Apply the mask: board where there's content, background elsewhere
-        result = np.where(mask_3d, board_img, bg)
+        final_mask = cv2.bitwise_or(content_mask, color_mask)
         
-        # Copy result back to background
-        background[:] = result.astype(np.uint8)
+        # Apply the mask in place: board where there's content, background elsewhere
+        cv2.copyTo(board, final_mask, background)
     
     def add_player_move(self, player: int, move: str):
         """Add a move to the player's move history."""
+        # The deques keep only the last 10 moves for display
         if player == 1:
             self.player1_moves.append(move)
-            # Keep only last 10 moves for display
-            if len(self.player1_moves) > 10:
-                self.player1_moves.pop(0)
         elif player == 2:
             self.player2_moves.append(move)
-            if len(self.player2_moves) > 10:
-                self.player2_moves.pop(0)
         
         logger.debug(f"Player {player} move added: {move}")
     
@@ -211,18 +230,19 @@ class GameUI:
             available_height = 200  # Minimum reasonable height
         
         history_lines = self.history_display.get_formatted_display_text(player_color, available_height)
-        move_counts = self.history_display.get_move_counts()
+        history = self.history_display.white_history if player == 1 else self.history_display.black_history
         
         color = self.player1_color if player == 1 else self.player2_color
         
         # Move count
-        move_count = move_counts["white"] if player == 1 else move_counts["black"]
+        move_count = history.get_move_count()
         count_text = f"Moves: {move_count}"
         cv2.putText(self.ui_canvas, count_text, (x + 10, moves_start_y),
                    cv2.FONT_HERSHEY_SIMPLEX, 0.6, self.text_color, 1, cv2.LINE_AA)
         
-        # Display history - starts from line 2 since first line is player name (shown separately)
-        display_lines = history_lines[1:] if len(history_lines) > 1 else []
+        # Display history - starts from line 2 since first line is player name (shown separately).
+        # history_lines is the display's cached list, so it is indexed instead of sliced
+        num_lines = len(history_lines)
         
         # Calculate maximum lines that can fit dynamically
         line_height = 20
@@ -231,14 +251,16 @@ class GameUI:
         
         # Always keep the score line if it exists (it's usually the last line)
         score_line = None
-        if display_lines and display_lines[-1].startswith("Score:"):
-            score_line = display_lines[-1]
-            display_lines = display_lines[:-1]  # Remove score from display_lines temporarily
+        moves_end = num_lines
+        if num_lines > 1 and history_lines[-1].startswith("Score:"):
+            score_line = history_lines[-1]
+            moves_end -= 1  # Leave the score out of the move lines
         
         # Display the moves, but leave room for the score
-        lines_to_show = min(len(display_lines), max_display_lines - (1 if score_line else 0))
+        lines_to_show = max(0, min(moves_end - 1, max_display_lines - (1 if score_line else 0)))
         
-        for i, line in enumerate(display_lines[:lines_to_show]):
+        for i in range(lines_to_show):
+            line = history_lines[1 + i]
             line_y = moves_start_y + 30 + (i * line_height)
             # Make sure we don't draw beyond the screen
             if line_y > self.ui_height - 60:  # Leave more space at bottom for score
@@ -278,7 +300,7 @@ class GameUI:
         name_y = board_y + 30  # Same level as board top + a bit down
         
         # White player name (centered in left space)
-        white_text_size = cv2.getTextSize(white_name, font, font_scale, thickness)[0]
+        white_text_size = _text_size(white_name, font, font_scale, thickness)[0]
         left_space_width = board_x - 20  # Space from left edge to board minus margin
         white_x = (left_space_width - white_text_size[0]) // 2  # Center in left space
         
@@ -289,7 +311,7 @@ class GameUI:
             cv2.putText(self.ui_canvas, white_name, (white_x, name_y), font, font_scale, white_color, thickness, cv2.LINE_AA)
         
         # Black player name (centered in right space)
-        black_text_size = cv2.getTextSize(black_name, font, font_scale, thickness)[0]
+        black_text_size = _text_size(black_name, font, font_scale, thickness)[0]
         right_space_start = board_x + self.board_size + 20  # Start of right space
         right_space_width = self.ui_width - right_space_start - 20  # Available space minus margin
         black_x = right_space_start + (right_space_width - black_text_size[0]) // 2  # Center in right space
@@ -327,7 +349,7 @@ class GameUI:
         max_moves = max(1, available_height // 25)  # Each move takes 25px, minimum 1 move
         
         # Show the last moves that fit in the window
-        moves_to_show = moves[-max_moves:] if len(moves) > max_moves else moves
+        moves_to_show = list(moves)[-max_moves:] if len(moves) > max_moves else moves
         for i, move in enumerate(moves_to_show):
             move_y = moves_start_y + (i * 25)
             if move_y < self.ui_height - 10:  # Make sure we don't go off screen
@@ -340,83 +362,106 @@ class GameUI:
     
     def render_complete_ui(self, board: Board):
         """Render the complete UI including board and player information."""
-        # Start with fresh UI canvas with background image
-        import numpy as np
+        # The ENTIRE board image should show on top of the background (see _compute_layout)
+        board_x, board_y = self._board_x, self._board_y
+        
+        # Background, player names and history panels only change on a move,
+        # capture or name change; they are drawn into a cached layer then and
+        # every other frame reuses it. None of this text overlaps the board.
+        static_key = self._static_layer_key()
+        if static_key != self._static_key:
+            self._render_static_layer()  # Leaves the canvas holding the new layer
+            self._static_key = static_key
+        elif self._message_roi is not None:
+            # The rest of the canvas still holds the static layer; only the last
+            # message box has to be erased (the board is overwritten below)
+            x1, y1, x2, y2 = self._message_roi
+            np.copyto(self.ui_canvas[y1:y2, x1:x2], self._static_layer[y1:y2, x1:x2])
+        self._message_roi = None
         
-        # Place the game board in the center - the ENTIRE board image should show on top of background
-        board_x = (self.ui_width - self.board_size) // 2
-        board_y = (self.ui_height - self.board_size) // 2
-        
-        # First draw the background image covering the entire canvas
-        if self.background_img and self.background_img.img is not None:
-            # Resize background to fit the entire UI canvas
-            bg_resized = cv2.resize(self.background_img.img, (self.ui_width, self.ui_height))
-            self.ui_canvas = bg_resized.copy()
+        # THEN place the board image on top of everything
+        board_area = self.ui_canvas[board_y:board_y + self.board_size, 
+                                    board_x:board_x + self.board_size]
+        if board.img.img is None:
+            np.copyto(board_area, self._static_layer[board_y:board_y + self.board_size,
+                                                     board_x:board_x + self.board_size])
+        # Handle different image formats (RGB vs RGBA)
+        elif board.img.img.shape[2] == 4:  # RGBA image
+            # Convert RGBA to RGB, through a reused buffer and into the canvas
+            cv2.resize(board.img.img, (self.board_size, self.board_size), dst=self._board_rgba)
+            cv2.cvtColor(self._board_rgba, cv2.COLOR_RGBA2RGB, dst=board_area)
         else:
-            # Fallback to dark background if no background image
-            self.ui_canvas = np.full((self.ui_height, self.ui_width, 3), 
-                                    self.bg_color, dtype=np.uint8)
+            # Place the ENTIRE board image on top of the background,
+            # scaled straight into its area of the canvas
+            cv2.resize(board.img.img, (self.board_size, self.board_size), dst=board_area)
         
-        # Redraw panels (transparent ones) on top of background
-        self._draw_ui_panels()
+        # Title removed as requested
         
-        # THEN place the board image on top of everything
-        if board.img.img is not None:
-            board_resized = cv2.resize(board.img.img, (self.board_size, self.board_size))
-            
-            # Handle different image formats (RGB vs RGBA)
-            if board_resized.shape[2] == 4:  # RGBA image
-                # Convert RGBA to RGB
-                board_resized = cv2.cvtColor(board_resized, cv2.COLOR_RGBA2RGB)
-            
-            # Place the ENTIRE board image on top of the background
-            self.ui_canvas[board_y:board_y + self.board_size, 
-                          board_x:board_x + self.board_size] = board_resized
+        # Render game messages (start/end messages) on top of everything
+        self._render_game_messages()
+    
+    def _static_layer_key(self) -> tuple:
+        """Everything the static layer depends on: player names, histories and scores."""
+        history = self.history_display
+        return (self.player_names_manager.get_white_player_name(),
+                self.player_names_manager.get_black_player_name(),
+                history.white_history.version,
+                history.black_history.version,
+                history.score_manager.get_white_score(),
+                history.score_manager.get_black_score())
+    
+    def _render_static_layer(self):
+        """Draw the background, player names and history panels into the static layer."""
+        np.copyto(self.ui_canvas, self._bg_cached)
         
-        # Draw player information on the sides - aligned with board top edge
-        board_y = (self.ui_height - self.board_size) // 2  # Calculate board's top position
-        board_x = (self.ui_width - self.board_size) // 2   # Calculate board's left position
+        # Redraw panels (transparent ones) on top of background
+        self._draw_ui_panels()
         
         # Draw large player names at the sides of the board
-        self._draw_large_player_names(board_x, board_y)
+        self._draw_large_player_names(self._board_x, self._board_y)
         
-        # Calculate equal spacing for panels
-        # Left panel - centered in the space between left edge and board
-        left_panel_width = board_x - 40  # Leave 20px margin on each side
-        left_panel_x = (board_x - left_panel_width) // 2
-        
-        # Right panel - centered in the space between board and right edge
-        right_space_width = self.ui_width - (board_x + self.board_size) - 40  # Leave 20px margin on each side
-        right_panel_x = board_x + self.board_size + (right_space_width - 250) // 2 + 20  # 250 is approx panel width
-        
-        # Position panels below the player names
-        panel_start_y = board_y + 50  # Start panels below the player names
-        self._draw_player_info_with_history(1, left_panel_x, panel_start_y)   # Player 1 - left side, centered
-        self._draw_player_info_with_history(2, right_panel_x, panel_start_y)  # Player 2 - right side, centered
-        self._draw_player_info_with_history(2, right_panel_x, panel_start_y)  # Player 2 - right side
-        
-        # Title removed as requested
+        # Panels sit below the player names, centered beside the board
+        self._draw_player_info_with_history(1, self._left_panel_x, self._panel_start_y)   # Player 1 - left side
+        self._draw_player_info_with_history(2, self._right_panel_x, self._panel_start_y)  # Player 2 - right side
         
-        # Render game messages (start/end messages) on top of everything
-        self._render_game_messages()
+        np.copyto(self._static_layer, self.ui_canvas)
     
     def _render_game_messages(self):
         """Render game start/end messages overlaid on the UI."""
-        # Update message display state
-        self.message_display.update()
+        # Update message display state; the fade uses the same clock reading
+        now = self.message_display.update()
         
         current_message = self.message_display.get_current_message()
         if current_message:
-            alpha = self.message_display.get_message_alpha()
+            alpha = self.message_display.get_message_alpha(now)
             if alpha > 0.0:
                 self._draw_message_overlay(current_message, alpha)
     
     def _draw_message_overlay(self, message: str, alpha: float):
         """Draw a message overlay with transparency effect."""
-        import numpy as np
+        stamp = self._message_stamp(message)
+        if stamp is None:
+            return
+        (roi_x1, roi_y1, roi_x2, roi_y2), box, box_mask = stamp
+        
+        # Only the message box is blended: its region of the canvas with the
+        # pre-drawn box pasted over it
+        roi = self.ui_canvas[roi_y1:roi_y2, roi_x1:roi_x2]
+        self._message_roi = (roi_x1, roi_y1, roi_x2, roi_y2)
+        overlay = roi.copy()
+        cv2.copyTo(box, box_mask, overlay)
         
-        # Create overlay
-        overlay = self.ui_canvas.copy()
+        # Blend overlay with original canvas using alpha
+        cv2.addWeighted(overlay, alpha, roi, 1 - alpha, 0, roi)
+    
+    def _message_stamp(self, message: str):
+        """The drawn message box as (region, pixels, mask of the pixels that cover the canvas).
+        
+        The box, its border and the glowing text do not change while a message
+        fades, so they are rasterized once per message rather than every frame.
+        """
+        if self._message_stamp_cache is not None and self._message_stamp_cache[0] == message:
+            return self._message_stamp_cache[1]
         
         # Message styling
         font = cv2.FONT_HERSHEY_DUPLEX
@@ -424,7 +469,7 @@ class GameUI:
         thickness = 3
         
         # Get text size
-        (text_width, text_height), baseline = cv2.getTextSize(message, font, font_scale, thickness)
+        (text_width, text_height), baseline = _text_size(message, font, font_scale, thickness)
         
         # Center the message
         text_x = (self.ui_width - text_width) // 2
@@ -437,34 +482,72 @@ class GameUI:
         bg_x2 = text_x + text_width + padding
         bg_y2 = text_y + baseline + padding
         
-        # Draw semi-transparent background
-        cv2.rectangle(overlay, (bg_x1, bg_y1), (bg_x2, bg_y2), (0, 0, 0), -1)
-        
-        # Draw border
-        cv2.rectangle(overlay, (bg_x1, bg_y1), (bg_x2, bg_y2), (255, 255, 255), 2)
-        
-        # Draw text with glow effect (multiple layers)
-        # Glow layers
-        for offset in [(2, 2), (-2, -2), (2, -2), (-2, 2)]:
-            cv2.putText(overlay, message, (text_x + offset[0], text_y + offset[1]),
-                       font, font_scale, (50, 50, 50), thickness + 2, cv2.LINE_AA)
-        
-        # Main text
-        cv2.putText(overlay, message, (text_x, text_y),
-                   font, font_scale, (255, 255, 255), thickness, cv2.LINE_AA)
+        # The box (plus its 2px border), clipped to the canvas
+        roi_x1, roi_y1 = max(bg_x1 - 2, 0), max(bg_y1 - 2, 0)
+        roi_x2, roi_y2 = min(bg_x2 + 3, self.ui_width), min(bg_y2 + 3, self.ui_height)
+        stamp = None
+        if roi_x1 < roi_x2 and roi_y1 < roi_y2:
+            # Drawing coordinates relative to the region
+            bg_x1, bg_x2, text_x = bg_x1 - roi_x1, bg_x2 - roi_x1, text_x - roi_x1
+            bg_y1, bg_y2, text_y = bg_y1 - roi_y1, bg_y2 - roi_y1, text_y - roi_y1
+            
+            # Draw the box over black and over white: pixels that come out the
+            # same in both are fully covered by the box, the rest show the canvas
+            drawn = []
+            for fill in (0, 255):
+                overlay = np.full((roi_y2 - roi_y1, roi_x2 - roi_x1, 3), fill, dtype=np.uint8)
+                
+                # Draw semi-transparent background
+                cv2.rectangle(overlay, (bg_x1, bg_y1), (bg_x2, bg_y2), (0, 0, 0), -1)
+                
+                # Draw border
+                cv2.rectangle(overlay, (bg_x1, bg_y1), (bg_x2, bg_y2), (255, 255, 255), 2)
+                
+                # Draw text with glow effect (multiple layers)
+                # Glow layers
+                for offset in [(2, 2), (-2, -2), (2, -2), (-2, 2)]:
+                    cv2.putText(overlay, message, (text_x + offset[0], text_y + offset[1]),
+                               font, font_scale, (50, 50, 50), thickness + 2, cv2.LINE_AA)
+                
+                # Main text
+                cv2.putText(overlay, message, (text_x, text_y),
+                           font, font_scale, (255, 255, 255), thickness, cv2.LINE_AA)
+                drawn.append(overlay)
+            
+            box_mask = np.all(drawn[0] == drawn[1], axis=2).astype(np.uint8)
+            stamp = ((roi_x1, roi_y1, roi_x2, roi_y2), drawn[0], box_mask)
         
-        # Blend overlay with original canvas using alpha
-        alpha_int = int(alpha * 255)
-        cv2.addWeighted(overlay, alpha, self.ui_canvas, 1 - alpha, 0, self.ui_canvas)
+        self._message_stamp_cache = (message, stamp)
+        return stamp
     
     def show(self):
         """Display the complete UI."""
         cv2.imshow("KFC Chess Game", self.ui_canvas)
+        self.pump_events()
+
+    def encode_frame(self) -> bytes:
+        """Serialize the current frame (e.g. for streaming or recording)."""
+        # PPM is a raw header + pixels; PNG would spend each frame on DEFLATE
+        ok, buf = cv2.imencode(".ppm", self.ui_canvas)
+        if not ok:
+            raise RuntimeError("Failed to encode UI frame")
+        return buf.tobytes()
+
+    def is_animating(self) -> bool:
+        """Whether the UI changes on its own (a message is showing or fading) and must be re-rendered."""
+        return self.message_display.get_current_message() is not None
+    
+    def pump_events(self) -> int:
+        """Let the window process its events (and paint the last imshow); returns the key pressed, or -1."""
+        # pollKey does not sleep, unlike waitKey(1) which waits at least 1 ms
+        # every frame; it only exists in OpenCV 4.5.3+
+        key = _poll_key()
+        self._last_key = key
         
         # Handle ESC key for graceful exit
-        key = cv2.waitKey(1) & 0xFF
-        if key == 27:  # ESC key
+        if key & 0xFF == 27:  # ESC key
             raise KeyboardInterrupt("ESC pressed - exiting game")
+        return key
     
     def simulate_sample_data(self):
         """Add some sample data for testing the UI display."""
@@ -496,9 +579,9 @@ def enhance_game_with_ui(game: Game, pieces_folder: pathlib.Path) -> GameUI:
     original_draw = game._draw
     original_show = game._show
     
-    def enhanced_draw():
+    def enhanced_draw(now_ms=None):
         # First, call the original draw logic to render pieces on the board
-        original_draw()
+        original_draw(now_ms)
         
         # Then enhance the board with background while preserving the pieces
         if hasattr(game, 'curr_board') and game.curr_board:
@@ -523,7 +606,6 @@ def enhance_game_with_ui(game: Game, pieces_folder: pathlib.Path) -> GameUI:
 # Example usage and testing function
 def test_ui_display():
     """Test function to display the UI with sample data."""
-    import numpy as np
     from Board import Board
     from MessageBroker import MessageBroker
     
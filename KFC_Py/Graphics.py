@@ -3,6 +3,7 @@ from dataclasses import dataclass, field
 from typing import List, Dict, Tuple, Optional
 from img import Img
 import copy
+import math
 from Command import Command
 
 import logging
@@ -26,6 +27,7 @@ class Graphics:
         self.start_ms = 0
         self.cur_frame = 0
         self.frame_duration_ms = 1000 / fps
+        self._next_frame_ms = self.frame_duration_ms
         logger.debug(f"[LOAD] Graphics from: {sprites_folder}")
 
     def copy(self):
@@ -44,15 +46,23 @@ class Graphics:
     def reset(self, cmd: Command):
         self.start_ms = cmd.timestamp
         self.cur_frame = 0
+        self._next_frame_ms = cmd.timestamp + self.frame_duration_ms
 
     def update(self, now_ms: int):
         elapsed = now_ms - self.start_ms
         frames_passed = int(elapsed / self.frame_duration_ms)
+        self._next_frame_ms = self.start_ms + (frames_passed + 1) * self.frame_duration_ms
         if self.loop:
             self.cur_frame = frames_passed % len(self.frames)
         else:
             self.cur_frame = min(frames_passed, len(self.frames) - 1)
 
+    def next_event_ms(self) -> float:
+        """Game time at which update() would show a different frame."""
+        if len(self.frames) == 1 or (not self.loop and self.cur_frame == len(self.frames) - 1):
+            return math.inf
+        return self._next_frame_ms
+
     def get_img(self) -> Img:
         if not self.frames:
             raise ValueError("No frames loaded for animation.")
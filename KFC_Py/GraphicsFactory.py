@@ -15,6 +15,14 @@ class ImgFactory:
         keep_aspect = kwargs.get("keep_aspect", args[2] if len(args) >= 3 else False)
         return Img().read(path, size, keep_aspect)
 
+    # Factories are stateless, so all instances of one class are
+    # interchangeable (and share cache entries keyed by the factory)
+    def __eq__(self, other):
+        return type(self) is type(other)
+
+    def __hash__(self):
+        return hash(type(self))
+
 class MockImgFactory(ImgFactory):
     def __call__(self, *args, **kwargs):
         path = args[0]
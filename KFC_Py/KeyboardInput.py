@@ -1,5 +1,6 @@
 import threading, logging
 import keyboard  # pip install keyboard
+from typing import Optional
 from Command import Command
 
 logger = logging.getLogger(__name__)
@@ -17,6 +18,7 @@ class KeyboardProcessor:
         self.keymap = keymap
         self._cursor = list(initial_pos)  # Start at specified position
         self._lock = threading.Lock()
+        self._prev_snapshot: dict[str, bool] = {}  # key state at the last poll
 
     def process_key(self, event):
         # Only care about key‑down events
@@ -39,6 +41,10 @@ class KeyboardProcessor:
         if key in hebrew_to_english:
             key = hebrew_to_english[key]
         
+        return self._apply_key(key)
+
+    def _apply_key(self, key: str):
+        """Map *key* to its action, moving the cursor for direction keys."""
         action = self.keymap.get(key)
         logger.debug("Key '%s' → action '%s'", key, action)
 
@@ -58,6 +64,17 @@ class KeyboardProcessor:
 
         return action
 
+    def snapshot(self) -> dict[str, bool]:
+        """Read the current up/down state of every key in the keymap."""
+        return {key: keyboard.is_pressed(key) for key in self.keymap}
+
+    def poll_actions(self) -> list[str]:
+        """Return the actions of the keys pressed down since the last poll."""
+        snap = self.snapshot()
+        prev, self._prev_snapshot = self._prev_snapshot, snap
+        return [self._apply_key(key) for key, down in snap.items()
+                if down and not prev.get(key)]
+
     def get_cursor(self) -> tuple[int, int]:
         with self._lock:
             return tuple(self._cursor)
@@ -89,9 +106,29 @@ class KeyboardProducer(threading.Thread):
 
     def _on_event(self, event):
         action = self.proc.process_key(event)
+        cmd = self._handle_action(action, self.game.game_time_ms())
+        if cmd is not None:
+            self.queue.put(cmd)
+            logger.info(f"Player{self.player} queued {cmd}")
+
+    def drain_commands(self, now_ms: int) -> list[Command]:
+        """Poll the keyboard state and return the commands it produced.
+
+        Used instead of the hook thread when the game loop polls input once
+        per tick; no queue sits between the key press and the command.
+        """
+        cmds = []
+        for action in self.proc.poll_actions():
+            cmd = self._handle_action(action, now_ms)
+            if cmd is not None:
+                cmds.append(cmd)
+        return cmds
+
+    def _handle_action(self, action, now_ms: int) -> Optional[Command]:
+        """Apply a select/jump *action* at the cursor; return the resulting command, if any."""
         # only interpret select/jump
         if action not in ("select", "jump"):
-            return
+            return None
 
         cell = self.proc.get_cursor()
         
@@ -101,13 +138,13 @@ class KeyboardProducer(threading.Thread):
                 piece = self._find_piece_at(cell)
                 if not piece:
                     print(f"[WARN] No piece at {cell}")
-                    return
+                    return None
 
                 # Check if the piece belongs to this player's color
                 piece_color = piece.id[1]  # W or B
                 if piece_color != self.my_color:
                     print(f"[WARN] Player{self.player} ({self.my_color}) cannot select {piece.id} (color {piece_color})")
-                    return
+                    return None
 
                 self.selected_id = piece.id
                 self.selected_cell = cell
@@ -119,7 +156,7 @@ class KeyboardProducer(threading.Thread):
                     self.game.selected_id_2 = self.selected_id
                     
                 print(f"[KEY] Player{self.player} selected {piece.id} at {cell}")
-                return
+                return None
 
             elif cell == self.selected_cell:  # selected same place
                 self.selected_id = None
@@ -128,17 +165,15 @@ class KeyboardProducer(threading.Thread):
                     self.game.selected_id_1 = None
                 else:
                     self.game.selected_id_2 = None
-                return
+                return None
 
             else:
                 cmd = Command(
-                    self.game.game_time_ms(),
+                    now_ms,
                     self.selected_id,
                     "move",
                     [self.selected_cell, cell]
                 )
-                self.queue.put(cmd)
-                logger.info(f"Player{self.player} queued {cmd}")
                 self.selected_id = None
                 self.selected_cell = None
                 
@@ -147,21 +182,21 @@ class KeyboardProducer(threading.Thread):
                     self.game.selected_id_1 = None
                 else:
                     self.game.selected_id_2 = None
+                return cmd
 
         elif action == "jump":
             if self.selected_id is None:
                 print(f"[WARN] Player{self.player} tried to jump but no piece selected")
-                return
+                return None
             
             cmd = Command(
-                self.game.game_time_ms(),
+                now_ms,
                 self.selected_id,
                 "jump",
                 [self.selected_cell]  # Pass current cell to the command
             )
-            self.queue.put(cmd)
-            logger.info(f"Player{self.player} queued {cmd}")
             # We don't deselect the piece after a jump
+            return cmd
 
 
     def stop(self):
@@ -101,33 +101,53 @@ class MessageDisplay(Subscriber):
         print(f"INFO: Displaying message: '{message}' for {duration} seconds")
     
     def _hide_current_message(self):
-        """Hide the current message immediately."""
+        """Hide the current message immediately and announce its dismissal."""
+        message = self.current_message
         self.current_message = None
         self.message_start_time = None
         print("DEBUG: Message hidden")
+        if message is not None:
+            self.broker.publish(EventType.MESSAGE_DISMISSED, {"message": message})
     
-    def update(self):
-        """Update message display state. Call this regularly from game loop."""
+    def update(self, now: Optional[float] = None) -> float:
+        """
+        Update message display state. Call this regularly from game loop.
+        
+        Args:
+            now: Timestamp of this tick (read from the clock when omitted)
+            
+        Returns:
+            The timestamp used, so the same tick can pass it to get_message_alpha
+        """
+        if now is None:
+            now = time.time()
         if self.current_message and self.message_start_time is not None:
-            elapsed = time.time() - self.message_start_time
+            elapsed = now - self.message_start_time
             
             if elapsed >= self.message_duration:
                 # Message duration expired, hide it
                 self._hide_current_message()
+        return now
     
     def get_current_message(self) -> Optional[str]:
         """Get the currently displayed message, if any."""
         return self.current_message
     
-    def get_message_alpha(self) -> float:
+    def get_message_alpha(self, now: Optional[float] = None) -> float:
         """
         Get the alpha value for message display (for fade effects).
         Returns value between 0.0 (invisible) and 1.0 (fully visible).
+        
+        Args:
+            now: Timestamp of this tick, e.g. as returned by update()
+                 (read from the clock when omitted)
         """
         if not self.current_message or self.message_start_time is None:
             return 0.0
         
-        elapsed = time.time() - self.message_start_time
+        if now is None:
+            now = time.time()
+        elapsed = now - self.message_start_time
         
         # Fade in
         if elapsed < self.message_fade_duration:
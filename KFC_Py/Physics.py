@@ -51,6 +51,10 @@ class BasePhysics(ABC):  # Interface/base class
     def get_start_ms(self) -> int:
         return self._start_ms
 
+    def next_event_ms(self) -> float:
+        """Game time at which update() next has work to do (default: every tick)."""
+        return -math.inf
+
     def can_be_captured(self) -> bool: return True
 
     def can_capture(self) -> bool:     return True
@@ -71,6 +75,9 @@ class IdlePhysics(BasePhysics):
     def update(self, now_ms: int):
         return None
 
+    def next_event_ms(self) -> float:
+        return math.inf  # idle until a command arrives
+
     def can_capture(self) -> bool:
         return False
 
@@ -134,6 +141,9 @@ class StaticTemporaryPhysics(BasePhysics):
 
         return None
 
+    def next_event_ms(self) -> float:
+        return self._start_ms + self.duration_s * 1000
+
 
 class JumpPhysics(StaticTemporaryPhysics):
     def reset(self, cmd: Command):
@@ -22,6 +22,10 @@ class Piece:
     def update(self, now_ms: int):
         self.state = self.state.update(now_ms)
 
+    def next_event_ms(self) -> float:
+        """Game time before which update() is a no-op for this piece."""
+        return self.state.next_event_ms()
+
     def is_movement_blocker(self) -> bool:
         return self.state.physics.is_movement_blocker()
 
@@ -1,8 +1,8 @@
 # PieceFactory.py
 from __future__ import annotations
-import csv, json, pathlib
+import copy, csv, json, os, pathlib
 from plistlib import InvalidFileException
-from typing import Dict, Tuple
+from typing import Dict, Optional, Tuple
 
 from Board import Board
 from Command import Command
@@ -13,6 +13,37 @@ from Piece import Piece
 from State import State
 
 
+class PieceTemplate:
+    """The loaded state machine of one piece type, cloned for every piece.
+
+    Sprites, moves and configs are read once; each instance gets its own
+    State/Graphics/Physics objects, sharing only the immutable sprite frames
+    and move tables.
+    """
+
+    def __init__(self, p_type: str, states: Dict[str, State]):
+        self.p_type = p_type
+        self._states = states
+
+    def instantiate(self, cell: Tuple[int, int], board: Optional[Board] = None) -> Piece:
+        """Create a piece at *cell*; its physics use *board* if given, else the template's."""
+        states: Dict[str, State] = {}
+        for name, src in self._states.items():
+            physics = copy.copy(src.physics)
+            if board is not None:
+                physics.board = board
+            st = State(src.moves, src.graphics.copy(), physics)
+            st.name = name
+            states[name] = st
+        for name, src in self._states.items():
+            for ev, dst in src.transitions.items():
+                states[name].set_transition(ev, states[dst.name])
+
+        piece = Piece(f"{self.p_type}_{cell}", states.get("idle"))
+        piece.state.reset(Command(0, piece.id, "idle", [cell]))
+        return piece
+
+
 class PieceFactory:
     def __init__(self,
                  board: Board,
@@ -43,25 +74,38 @@ class PieceFactory:
 
     # ──────────────────────────────────────────────────────────────
     def _build_state_machine(self, piece_dir: pathlib.Path) -> State:
+        # always start at idle
+        return self._load_states(piece_dir).get("idle")
+
+    def _load_states(self, piece_dir: pathlib.Path) -> Dict[str, State]:
         board_size = (self.board.W_cells, self.board.H_cells)
         cell_px = (self.board.cell_W_pix, self.board.cell_H_pix)
-        _global_trans = self._load_master_csv(piece_dir / "states")
+        states_dir = piece_dir / "states"
+
+        # One directory scan per level replaces a stat() per probed file
+        with os.scandir(states_dir) as it:
+            state_entries = list(it)
+        has_trans = any(e.name == "transitions.csv" for e in state_entries)
+        _global_trans = self._load_master_csv(states_dir) if has_trans else {}
 
         states: Dict[str, State] = {}
 
         # There is no longer a piece-wide fall-back. Each state must provide its own
         # `moves.txt`; if it does not, the state will have *no* legal moves.
         # ── load every <piece>/states/<state>/ ───────────────────
-        for state_dir in (piece_dir / "states").iterdir():
-            if not state_dir.is_dir():
+        for entry in state_entries:
+            if not entry.is_dir():
                 continue
-            name = state_dir.name
+            name = entry.name
+            state_dir = pathlib.Path(entry.path)
+            with os.scandir(state_dir) as it:
+                files = {e.name for e in it}
 
             cfg_path = state_dir / "config.json"
-            cfg = json.loads(cfg_path.read_text()) if cfg_path.exists() else {}
+            cfg = json.loads(cfg_path.read_text()) if "config.json" in files else {}
 
             moves_path = state_dir / "moves.txt"
-            moves = Moves(moves_path, board_size) if moves_path.exists() else None
+            moves = Moves(moves_path, board_size) if "moves.txt" in files else None
             graphics = self.graphics_factory.load(state_dir / "sprites",
                                                   cfg.get("graphics", {}), cell_px)
             physics_cfg = cfg.get("physics", {})
@@ -84,10 +128,13 @@ class PieceFactory:
 
                 src.set_transition(ev, dst)
 
-        # always start at idle
-        return states.get("idle")
+        return states
 
     # ──────────────────────────────────────────────────────────────
+    def build_template(self, p_type: str) -> PieceTemplate:
+        """Load *p_type* once; use the template to create all its pieces."""
+        return PieceTemplate(p_type, self._load_states(self._pieces_root / p_type))
+
     def create_piece(self, p_type: str, cell: Tuple[int, int]) -> Piece:
         p_dir = self._pieces_root / p_type
         state = self._build_state_machine(p_dir)
@@ -32,6 +32,7 @@ class ScoreManager(Subscriber):
         
         # Subscribe to piece capture events
         self.broker.subscribe(EventType.PIECE_CAPTURED, self)
+        self.broker.subscribe(EventType.PIECE_CAPTURED_BATCH, self)
     
     def handle_event(self, event_type: EventType, data):
         """
@@ -39,10 +40,13 @@ class ScoreManager(Subscriber):
         
         Args:
             event_type: Type of event
-            data: Event data (captured piece info)
+            data: Event data (captured piece info, or a list of them for a batch)
         """
         if event_type == EventType.PIECE_CAPTURED:
             self._handle_piece_captured(data)
+        elif event_type == EventType.PIECE_CAPTURED_BATCH:
+            for captured_piece_data in data:
+                self._handle_piece_captured(captured_piece_data)
     
     def _handle_piece_captured(self, captured_piece_data):
         """
@@ -36,6 +36,7 @@ class SoundManager(Subscriber):
         # Subscribe to game events
         self.broker.subscribe(EventType.PIECE_MOVED, self)
         self.broker.subscribe(EventType.PIECE_CAPTURED, self)
+        self.broker.subscribe(EventType.PIECE_CAPTURED_BATCH, self)
         self.broker.subscribe(EventType.INVALID_MOVE, self)
         self.broker.subscribe(EventType.GAME_START, self)
         self.broker.subscribe(EventType.GAME_END, self)
@@ -95,6 +96,9 @@ class SoundManager(Subscriber):
                 self._play_move_sound()
             elif event_type == EventType.PIECE_CAPTURED:
                 self._play_capture_sound()
+            elif event_type == EventType.PIECE_CAPTURED_BATCH:
+                # Simultaneous captures share a single capture sound
+                self._play_capture_sound()
             elif event_type == EventType.INVALID_MOVE:
                 self._play_fail_sound()
             elif event_type == EventType.GAME_START:
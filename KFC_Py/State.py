@@ -74,6 +74,10 @@ class State:
         self.graphics.update(now_ms)
         return self
 
+    def next_event_ms(self) -> float:
+        """Game time at which update() next has work to do."""
+        return min(self.physics.next_event_ms(), self.graphics.next_event_ms())
+
     def can_be_captured(self) -> bool:
         return self.physics.can_be_captured()
 
@@ -126,6 +126,28 @@ class TestCollisions(unittest.TestCase):
         self.assertEqual(game.pieces[0].id, "PB_2", 
                         "Winner should remain")
     
+    def test_collision_after_incremental_cell_sync(self):
+        """Test that a piece synced into an occupied cell is checked for collisions"""
+
+        piece1 = self.create_piece("PW_1", (1, 1), "idle")
+        piece2 = self.create_piece("PB_2", (2, 2), "idle")
+
+        self.pieces = [piece1, piece2]
+        game = Game(self.pieces, self.board, validate_board=False)
+
+        # Nothing shares a cell yet
+        game._resolve_collisions()
+        self.assertEqual(len(game.pieces), 2)
+
+        # Move piece2 onto piece1 and file it under its new cell
+        piece2.state.reset(Command(time.time_ns(), piece2.id, "idle", [(1, 1)]))
+        piece2.state.physics._start_ms = piece1.state.physics._start_ms + 1000
+        game._sync_piece_cell(piece2)
+
+        game._resolve_collisions()
+        self.assertEqual([p.id for p in game.pieces], ["PB_2"])
+        self.assertEqual(game.pos[(1, 1)], [piece2])
+
     def test_knight_moving_no_collision(self):
         """Test that knights moving don't cause collisions"""
         
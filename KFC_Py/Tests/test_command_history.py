@@ -28,7 +28,7 @@ class TestCommandHistoryManager(unittest.TestCase):
         self.assertEqual(self.white_history.player_color, "W")
         self.assertEqual(self.black_history.player_color, "B")
         self.assertIsNotNone(self.white_history.broker)
-        self.assertTrue(self.white_history.command_history.empty())
+        self.assertEqual(len(self.white_history.command_history), 0)
         self.assertEqual(len(self.white_history.formatted_history), 0)
     
     def test_piece_ownership_check(self):
@@ -60,11 +60,11 @@ class TestCommandHistoryManager(unittest.TestCase):
         self.broker.publish(EventType.PIECE_MOVED, command)
         
         # Check that white history recorded the move
-        self.assertFalse(self.white_history.command_history.empty())
+        self.assertEqual(len(self.white_history.command_history), 1)
         self.assertEqual(len(self.white_history.formatted_history), 1)
         
         # Black history should be empty
-        self.assertTrue(self.black_history.command_history.empty())
+        self.assertEqual(len(self.black_history.command_history), 0)
         self.assertEqual(len(self.black_history.formatted_history), 0)
     
     def test_black_piece_move_recorded(self):
@@ -81,11 +81,11 @@ class TestCommandHistoryManager(unittest.TestCase):
         self.broker.publish(EventType.PIECE_MOVED, command)
         
         # Check that black history recorded the move
-        self.assertFalse(self.black_history.command_history.empty())
+        self.assertEqual(len(self.black_history.command_history), 1)
         self.assertEqual(len(self.black_history.formatted_history), 1)
         
         # White history should be empty
-        self.assertTrue(self.white_history.command_history.empty())
+        self.assertEqual(len(self.white_history.command_history), 0)
         self.assertEqual(len(self.white_history.formatted_history), 0)
     
     def test_multiple_moves_recorded(self):
@@ -113,7 +113,7 @@ class TestCommandHistoryManager(unittest.TestCase):
         self.assertEqual(len(self.white_history.formatted_history), 2)
         
         # Check that moves are in correct order by examining the formatted descriptions
-        descriptions = [entry["description"] for entry in self.white_history.formatted_history]
+        descriptions = self.white_history.get_formatted_history()
         self.assertEqual(len(descriptions), 2)
         
         # Both descriptions should contain piece names and positions
@@ -135,7 +135,7 @@ class TestCommandHistoryManager(unittest.TestCase):
         
         # Check that jump was recorded
         self.assertEqual(len(self.white_history.formatted_history), 1)
-        description = self.white_history.formatted_history[0]["description"]
+        description = self.white_history.get_formatted_history()[0]
         self.assertIn("Bishop", description)
         self.assertIn("->", description)  # Should show movement
     
@@ -153,9 +153,32 @@ class TestCommandHistoryManager(unittest.TestCase):
         self.broker.publish(EventType.PIECE_MOVED, command)
         
         # History should remain empty since it's not a move/jump
-        self.assertTrue(self.white_history.command_history.empty())
+        self.assertEqual(len(self.white_history.command_history), 0)
         self.assertEqual(len(self.white_history.formatted_history), 0)
 
+    def test_formatted_tail(self):
+        """Test that the tail holds the last formatted moves, oldest first."""
+        for i in range(5):
+            cmd = Command(i * 1000, "PW", "move", [(6, i), (5, i)])
+            self.broker.publish(EventType.PIECE_MOVED, cmd)
+
+        full = self.white_history.get_formatted_history()
+        self.assertEqual(self.white_history.get_formatted_tail(2), full[-2:])
+        self.assertEqual(self.white_history.get_formatted_tail(10), full)
+        self.assertEqual(self.white_history.get_formatted_tail(0), [])
+
+    def test_history_as_table(self):
+        """Test that the table has the header followed by one row per move."""
+        self.assertEqual(self.white_history.get_history_as_table(), "No history for player W")
+
+        for i in range(3):
+            cmd = Command(i * 1000, "PW", "move", [(6, i), (5, i)])
+            self.broker.publish(EventType.PIECE_MOVED, cmd)
+
+        lines = self.white_history.get_history_as_table().split("\n")
+        self.assertEqual(lines[0], "Move History - White Player")
+        self.assertEqual(lines[4:], self.white_history.get_formatted_history() + [""])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -73,4 +73,29 @@ def test_piece_factory_generates_all_pieces():
             if i >= board.W_cells:
                 i = 0
                 j += 1
-    assert len(piece_ids) == num_pieces_created
\ No newline at end of file
+    assert len(piece_ids) == num_pieces_created
+
+def test_piece_template_instances_are_independent():
+    board = _board()
+    gfx_factory = GraphicsFactory(MockImgFactory())
+    p_factory = PieceFactory(board, pieces_root=PIECES_DIR, graphics_factory=gfx_factory)
+
+    tmpl = p_factory.build_template("PW")
+    p1 = tmpl.instantiate((6, 0))
+    p2 = tmpl.instantiate((6, 1))
+
+    assert p1.id == "PW_(6, 0)" and p2.id == "PW_(6, 1)"
+    assert p1.current_cell() == (6, 0)
+    assert p2.current_cell() == (6, 1)
+
+    # Each piece has its own state machine ...
+    assert p1.state is not p2.state
+    assert p1.state.physics is not p2.state.physics
+    assert p1.state.graphics is not p2.state.graphics
+    assert set(p1.state.transitions) == set(p2.state.transitions)
+    for ev, dst in p1.state.transitions.items():
+        assert dst is not p2.state.transitions[ev]
+        assert dst.name == p2.state.transitions[ev].name
+
+    # ... but the loaded sprite frames are shared
+    assert p1.state.graphics.frames is p2.state.graphics.frames
@@ -49,4 +49,73 @@ def test_graphics_factory_uses_custom_img_factory():
     gfx = gf.load(sprites_dir, cfg={}, cell_size=(32, 32))
 
     for frm in gfx.frames:
-        assert isinstance(frm, MockImg) 
\ No newline at end of file
+        assert isinstance(frm, MockImg) 
+
+def test_board_png_decoded_once_per_factory():
+    """Creating a second game with an equal factory should reuse the decoded board image."""
+    calls = []
+
+    class CountingImgFactory(MockImgFactory):
+        def __call__(self, *args, **kwargs):
+            if pathlib.Path(args[0]).name == "board.png":
+                calls.append(args[0])
+            return super().__call__(*args, **kwargs)
+
+    create_game(PIECES_DIR, CountingImgFactory())
+    create_game(PIECES_DIR, CountingImgFactory())
+
+    assert len(calls) == 1
+
+
+def test_disabled_subsystems_are_not_created():
+    """Feature flags should skip the sound/message subsystems and the names prompt."""
+    from GameFactory import create_game_with_history
+
+    names = MagicMock()
+    parts = create_game_with_history(PIECES_DIR, MockImgFactory(),
+                                     enable_sound=False,
+                                     enable_message_display=False,
+                                     player_names_manager=names)
+
+    assert parts.sound_manager is None and parts.message_display is None
+    assert parts.ui.player_names_manager is names
+    names.get_player_names_from_gui.assert_not_called()
+
+    # Still unpacks like the previous 6-tuple
+    game, ui, history_display, broker, sound_manager, message_display = parts
+    assert game is parts.game and len(game.pieces) == 32
+
+
+def test_prepare_game_only_loads_assets():
+    """prepare_game() should build the board and pieces without asking for names."""
+    from GameFactory import prepare_game
+
+    with patch('GameFactory.ask_player_names') as ask:
+        pieces, board = prepare_game(PIECES_DIR, MockImgFactory())
+
+    ask.assert_not_called()
+    assert len(pieces) == 32
+    assert (board.W_cells, board.H_cells) == (8, 8)
+
+
+def test_piece_sprites_loaded_once_per_root():
+    """A second game from the same assets should reuse the piece templates."""
+    from GameFactory import prepare_game
+
+    calls = []
+
+    class SpriteCountingImgFactory(MockImgFactory):
+        def __call__(self, *args, **kwargs):
+            if pathlib.Path(args[0]).name != "board.png":
+                calls.append(args[0])
+            return super().__call__(*args, **kwargs)
+
+    pieces1, board1 = prepare_game(PIECES_DIR, SpriteCountingImgFactory())
+    loaded = len(calls)
+    pieces2, board2 = prepare_game(PIECES_DIR, SpriteCountingImgFactory())
+
+    assert loaded > 0 and len(calls) == loaded
+    # Each game's pieces move on their own board
+    assert all(p.state.physics.board is board1 for p in pieces1)
+    assert all(p.state.physics.board is board2 for p in pieces2)
+    assert pieces1[0].state is not pieces2[0].state
@@ -108,6 +108,48 @@ class TestHistorySystem(unittest.TestCase):
         self.assertEqual(len(white_history), 1)
         self.assertTrue(white_history[0].startswith("01:01:01"))
 
+    def test_display_area_is_read_only(self):
+        """Test that display areas are returned as immutable records."""
+        area = self.history_display.get_display_area("W")
+        self.assertEqual((area.x, area.y, area.width, area.height), (850, 20, 300, 280))
+        self.assertIs(area, self.history_display.get_display_area("W"))
+        with self.assertRaises(AttributeError):
+            area.x = 0
+
+
+    def test_display_text_is_cached_until_history_changes(self):
+        """Test that display text is only rebuilt after a new move or score."""
+        first = self.history_display.get_formatted_display_text("W")
+        self.assertIs(first, self.history_display.get_formatted_display_text("W"))
+
+        self.broker.publish(EventType.PIECE_MOVED, Command(1000, "PW", "move", ["e2", "e4"]))
+        after_move = self.history_display.get_formatted_display_text("W")
+        self.assertIsNot(after_move, first)
+        self.assertTrue(any("Pawn" in line for line in after_move))
+
+        self.broker.publish(EventType.PIECE_CAPTURED, {"piece_id": "PB", "captured_by": "W"})
+        after_capture = self.history_display.get_formatted_display_text("W")
+        self.assertEqual(after_capture[-1], "Score: 1")
+
+    def test_default_player_names_manager_is_lazy(self):
+        """Test that the default names manager is only built on first access."""
+        self.assertNotIn("player_names_manager", vars(self.history_display))
+
+        # History and score are still tracked before anything is accessed
+        self.broker.publish(EventType.PIECE_MOVED, Command(1000, "PW", "move", ["e2", "e4"]))
+        self.broker.publish(EventType.PIECE_CAPTURED, {"piece_id": "PB", "captured_by": "W"})
+        self.assertEqual(self.history_display.get_move_counts()["white"], 1)
+        self.assertEqual(self.history_display.score_manager.get_white_score(), 1)
+
+        names = self.history_display.player_names_manager
+        self.assertIs(names, self.history_display.player_names_manager)
+
+        # A provided manager is used as is
+        provided = MagicMock()
+        display = GameHistoryDisplay(self.broker, provided)
+        self.assertIs(display.player_names_manager, provided)
+
+
 
 if __name__ == '__main__':
     unittest.main()
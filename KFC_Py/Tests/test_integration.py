@@ -92,5 +92,5 @@ def test_win_condition_detects_missing_king():
 
     # drop Black king and check _is_win()
     gone = [p for p in game.pieces if p.id.startswith("KB_")][0]
-    game.pieces.remove(gone)
+    game.pieces = [p for p in game.pieces if p is not gone]
     assert game._is_win() 
\ No newline at end of file
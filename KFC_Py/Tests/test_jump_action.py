@@ -69,6 +69,35 @@ def test_keyboard_jump_action():
     
     print("✓ Keyboard jump action test passed!")
 
+def test_polled_jump_action():
+    """Test that a polled jump key press yields one jump command per press."""
+    game = create_game("../pieces", MockImgFactory())
+
+    p1_map = {"enter": "select", "+": "jump"}
+    kp1 = KeyboardProcessor(8, 8, p1_map, initial_pos=(7, 1))
+    kb_prod_1 = KeyboardProducer(game, game.user_input_queue, kp1, player=1)
+    kb_prod_1.selected_id = "NW_1"
+    kb_prod_1.selected_cell = (7, 1)
+
+    # Simulate the key state read on three consecutive ticks: "+" is held
+    # down for the first two and released on the third
+    states = iter([{"enter": False, "+": True},
+                   {"enter": False, "+": True},
+                   {"enter": False, "+": False}])
+    kp1.snapshot = lambda: next(states)
+
+    cmds = kb_prod_1.drain_commands(100)
+    assert len(cmds) == 1
+    assert cmds[0].type == "jump" and cmds[0].piece_id == "NW_1"
+    assert cmds[0].timestamp == 100
+
+    # Holding the key does not repeat the command
+    assert kb_prod_1.drain_commands(116) == []
+    assert kb_prod_1.drain_commands(132) == []
+
+    # Polled commands bypass the input queue
+    assert game.user_input_queue.empty()
+
 if __name__ == "__main__":
     test_jump_command()
     test_keyboard_jump_action()
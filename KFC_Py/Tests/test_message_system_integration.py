@@ -193,6 +193,21 @@ class TestMessageDisplayAlpha(unittest.TestCase):
             alpha = self.message_display.get_message_alpha()
             self.assertEqual(alpha, 1.0, f"Alpha should be 1.0 at time {test_time}")
     
+    @patch('time.time')
+    def test_update_and_alpha_share_one_clock_reading(self, mock_time):
+        """Test that a tick's timestamp from update() drives the fade without re-reading the clock."""
+        mock_time.return_value = 0
+        self.message_display.handle_event(EventType.GAME_START, {})
+        
+        mock_time.return_value = 0.25
+        now = self.message_display.update()
+        self.assertEqual(now, 0.25)
+        
+        mock_time.return_value = 5.0  # Later clock reads would have hidden the message
+        self.assertAlmostEqual(self.message_display.get_message_alpha(now), 0.5, places=2)
+        self.assertEqual(self.message_display.update(now), now)
+        self.assertIsNotNone(self.message_display.current_message)
+    
     @patch('time.time')
     def test_alpha_when_no_message(self, mock_time):
         """Test that alpha is 0 when no message is displayed."""
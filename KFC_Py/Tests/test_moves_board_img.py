@@ -39,6 +39,24 @@ def test_img_draw_and_rectangle():
     dst.draw_rect(0, 0, 3, 3, (255, 0, 0))
 
 
+def test_img_copy_to_reuses_buffer():
+    src = _blank_img(4, 4)
+    dst = src.copy()
+    buf = dst.img
+    dst.img[:] = 0
+
+    # same shape → pixels are copied into the existing array
+    src.copy_to(dst)
+    assert dst.img is buf
+    assert np.array_equal(dst.img, src.img)
+
+    # different shape → the destination gets a fresh array
+    other = _blank_img(2, 2)
+    src.copy_to(other)
+    assert other.img.shape == src.img.shape
+    assert np.array_equal(other.img, src.img)
+
+
 # ---------------------------------------------------------------------------
 #                                   MOVES
 # ---------------------------------------------------------------------------
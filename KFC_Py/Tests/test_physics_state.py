@@ -125,4 +125,46 @@ def test_state_transitions_via_internal_done():
 
     # Advance time until JumpPhysics finishes → state machine auto-returns to idle
     piece.update(20)
-    assert piece.state is idle 
\ No newline at end of file
+    assert piece.state is idle 
+
+def test_next_event_ms():
+    board = _board()
+
+    idle_phys = IdlePhysics(board)
+    jump_phys = JumpPhysics(board, param=0.05)
+    idle = State(moves=None, graphics=_graphics(), physics=idle_phys)
+    jump = State(moves=None, graphics=_graphics(), physics=jump_phys)
+    idle.name = "idle"; jump.name = "jump"
+    idle.set_transition("jump", jump)
+    jump.set_transition("done", idle)
+
+    piece = Piece("PX", idle)
+    idle.reset(Command(0, piece.id, "idle", [(0, 0)]))
+
+    # An idle piece with a single-frame sprite never needs an update
+    assert piece.next_event_ms() == float("inf")
+
+    # A jump is due for an update when its cooldown expires
+    piece.on_command(Command(100, piece.id, "jump", [(0, 0)]), {})
+    assert piece.next_event_ms() == 150
+
+    # A moving piece changes position every tick
+    move = MovePhysics(board, param=1.0)
+    move.reset(Command(0, "P", "move", [(0, 0), (0, 2)]))
+    assert move.next_event_ms() == float("-inf")
+
+
+def test_graphics_next_event_ms():
+    from mock_img import MockImg
+    gfx = _graphics()
+    gfx.frames = [MockImg(), MockImg(), MockImg()]   # 1 fps → one frame per second
+    gfx.reset(Command(0, "P", "idle", []))
+    assert gfx.next_event_ms() == 1000
+
+    gfx.update(1500)
+    assert gfx.cur_frame == 1
+    assert gfx.next_event_ms() == 2000
+
+    # a non-looping animation stops on its last frame
+    gfx.update(2500)
+    assert gfx.next_event_ms() == float("inf")
@@ -163,11 +163,38 @@ def test_game_collision_resolution():
     pawn1.state.physics._start_ms = 100  # Earlier arrival
     pawn2.state.physics._start_ms = 200  # Later arrival
     
+    game._update_cell2piece_map()  # pawn1 was moved behind the game's back
     game._resolve_collisions()
     assert pawn2 in game.pieces  # Winner
     assert pawn1 not in game.pieces  # Captured
 
 
+def test_game_redraws_only_when_frame_changes():
+    """Idle ticks should not redraw; captures and UI messages should."""
+    from unittest.mock import Mock
+
+    board = _board()
+    pawn1 = _make_piece("PW_1", (4, 3), board)
+    pawn2 = _make_piece("PB_1", (4, 4), board)
+    game = Game([pawn1, pawn2], board, validate_board=False)
+    game.ui = Mock()
+    game.ui.is_animating.return_value = False
+
+    game._frame_dirty = False
+    assert not game._needs_redraw()
+
+    pawn1.state.reset(Command(100, pawn1.id, "idle", [(4, 4)]))
+    pawn1.state.physics._start_ms = 100
+    pawn2.state.physics._start_ms = 200
+    game._update_cell2piece_map()
+    game._resolve_collisions()
+    assert game._needs_redraw()
+
+    game._frame_dirty = False
+    game.ui.is_animating.return_value = True
+    assert game._needs_redraw()
+
+
 def test_game_keyboard_input():
     """Test keyboard input processing."""
     board = _board()
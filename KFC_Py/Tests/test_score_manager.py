@@ -96,7 +96,21 @@ class TestScoreManager(unittest.TestCase):
         # Check final scores
         self.assertEqual(self.score_manager.white_score, 8)  # 5 + 3
         self.assertEqual(self.score_manager.black_score, 3)  # 3
-    
+
+    def test_batched_captures(self):
+        """Test that a batch of captures scores every piece in it."""
+        batch = [
+            {'piece_id': 'RB1', 'captured_by': 'W'},
+            {'piece_id': 'PB2', 'captured_by': 'W'},
+            {'piece_id': 'NW1', 'captured_by': 'B'}
+        ]
+
+        # Publish the whole batch through the broker at once
+        self.broker.publish(EventType.PIECE_CAPTURED_BATCH, batch)
+
+        self.assertEqual(self.score_manager.white_score, 6)  # 5 + 1
+        self.assertEqual(self.score_manager.black_score, 3)  # 3
+
     def test_get_scores(self):
         """Test getting current scores."""
         # Add some points
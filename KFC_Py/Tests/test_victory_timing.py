@@ -1,4 +1,5 @@
 import unittest
+import itertools
 import time
 from unittest.mock import Mock, patch, MagicMock
 import sys
@@ -147,8 +148,7 @@ class TestVictoryTiming(unittest.TestCase):
         # Should not declare victory with both kings present
         self.assertFalse(game._is_win())
     
-    @patch('builtins.print')
-    def test_victory_debug_output(self, mock_print):
+    def test_victory_debug_output(self):
         """Test that victory detection produces correct debug output."""
         game = Game(self.pieces, self.board, self.broker, validate_board=False)
         
@@ -164,17 +164,14 @@ class TestVictoryTiming(unittest.TestCase):
             piece.state = idle_state
         
         # Call _is_win() to trigger debug output
-        result = game._is_win()
+        with self.assertLogs('Game', level='DEBUG') as logs:
+            result = game._is_win()
         
         # Verify victory was declared
         self.assertTrue(result)
         
-        # Check that debug messages were printed
-        debug_calls = [call for call in mock_print.call_args_list if 'DEBUG:' in str(call)]
-        self.assertGreater(len(debug_calls), 0)
-        
         # Check for specific victory debug message
-        victory_debug_found = any('Victory condition met' in str(call) for call in debug_calls)
+        victory_debug_found = any('Victory condition met' in line for line in logs.output)
         self.assertTrue(victory_debug_found)
 
 
@@ -215,23 +212,29 @@ class TestVictoryMessageIntegration(unittest.TestCase):
         return piece
     
     @patch('time.time')
-    @patch('time.sleep')
-    def test_victory_message_display_timing(self, mock_sleep, mock_time):
-        """Test that victory message is displayed for correct duration."""
-        # Mock time to control the 5-second display loop
-        mock_time.side_effect = [0, 1, 2, 3, 4, 5, 6]  # Simulate time progression
+    def test_victory_message_display_timing(self, mock_time):
+        """Test that victory message is displayed until it is dismissed."""
+        # Every time.time() call advances half a second of message time
+        mock_time.side_effect = itertools.count(0, 0.5)
         
         game = Game(self.pieces, self.board, self.broker, self.mock_ui, validate_board=False)
         
+        dismissed = []
+        mock_subscriber = Mock()
+        mock_subscriber.handle_event = lambda event_type, data: dismissed.append(data)
+        self.broker.subscribe(EventType.MESSAGE_DISMISSED, mock_subscriber)
+        
         # Call _announce_win to trigger message display
         game._announce_win()
         
-        # Verify UI was called multiple times during the victory message period
+        # The victory message expired and its dismissal ended the wait
+        self.assertEqual(len(dismissed), 1)
+        self.assertTrue(dismissed[0]["message"].endswith("Wins!"))
+        self.assertIsNone(self.message_display.current_message)
+        
+        # Verify UI was refreshed multiple times during the victory message period
         self.assertGreaterEqual(self.mock_ui.render_complete_ui.call_count, 4)
         self.assertGreaterEqual(self.mock_ui.show.call_count, 4)
-        
-        # Verify message display was updated
-        # Note: message_display.update() is called via hasattr check in the loop
     
     def test_victory_event_published(self):
         """Test that GAME_END event is published with correct data."""
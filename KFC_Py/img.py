@@ -62,6 +62,13 @@ class Img:
         new_img.img = self.img.copy()
         return new_img
 
+    def copy_to(self, other_img):
+        """Overwrite *other_img* with these pixels, reusing its buffer if it fits."""
+        if other_img.img is not None and other_img.img.shape == self.img.shape:
+            np.copyto(other_img.img, self.img)
+        else:
+            other_img.img = self.img.copy()
+
     def draw_on(self, other_img, x, y):
         if self.img is None or other_img.img is None:
             raise ValueError("Both images must be loaded before drawing.")